@@ -11,10 +11,15 @@ import socket
 import subprocess
 import time
 import select
+import signal
+import fcntl
+import struct
 import termios
 import tty
 import mmap
 import math
+import random
+import threading
 from datetime import datetime
 from pathlib import Path
 import yaml
@@ -22,6 +27,14 @@ from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 from typing import Optional
 
+from utils import setup_logging, load_build_info, log_runtime_summary, format_build_info
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 # Optional evdev input (touch/mouse)
 try:
     from evdev import InputDevice, ecodes, list_devices
@@ -38,6 +51,15 @@ RTCManager = None
 class FramebufferClock:
     """Direct framebuffer digital clock display."""
     
+    # Spacing of the pixel shift offset grid (px); +/-50 gives an 11x11 grid
+    PIXEL_SHIFT_GRID_STEP = 10
+
+    # linux/fb.h: _IOW('F', 0x20, __u32) - block until the next vertical blank
+    FBIO_WAITFORVSYNC = 0x40044620
+
+    # Status items that get a 10x10 vector icon in front of their label
+    STATUS_ICON_NAMES = frozenset(('network', 'error', 'sync_ok', 'sync_old', 'settings'))
+    
     def __init__(self, config: dict, build_info: Optional[dict] = None):
         """Initialize framebuffer clock."""
         self.config = config
@@ -64,8 +86,20 @@ class FramebufferClock:
         self._last_status_rect = None
         # Track dirty rectangles for partial framebuffer writes
         self._dirty_rects = []
+        # Last source array blitted per rect attr - identical re-blits are skipped
+        self._blit_sources = {}
+        # Elements already drawn this frame, in draw order (dict as an ordered set) -
+        # anything drawn after them is on top
+        self._frame_drawn = {}
+        # Set when something (e.g. the settings overlay) painted over the whole screen
+        self._needs_full_clear = False
+        # True while the screensaver has already blanked the display
+        self._screensaver_blanked = False
+        # Monotonic time of the last INFO-level render timing line
+        self._last_timing_log = float('-inf')
         # Try to memory-map framebuffer for fast partial writes
         self.fb_mmap = None
+        self._fb_view = None
         try:
             if self.fb_bpp == 16:
                 fb_size = self.fb_width * self.fb_height * 2
@@ -73,16 +107,26 @@ class FramebufferClock:
                 self.fb_mmap = mmap.mmap(fb.fileno(), fb_size, access=mmap.ACCESS_WRITE)
                 self._fb_stride_bytes = self.fb_width * 2
                 self._fb_file = fb  # keep file open for mapping lifetime
+                # 2D numpy view over the mapping: each dirty rect becomes one C-level copy
+                self._fb_view = np.frombuffer(self.fb_mmap, dtype='<u2').reshape((self.fb_height, self.fb_width))
                 logging.info("/dev/fb0 memory-mapped for fast partial updates")
         except Exception as e:
             self.fb_mmap = None
             self._fb_file = None
+            self._fb_view = None
             logging.warning(f"Framebuffer mmap not available, falling back to writes: {e}")
 
+        # Opt-in: wait for vblank before copying dirty rects so a changing digit never tears.
+        # Off by default - not every fbdev driver implements FBIO_WAITFORVSYNC
+        self.fb_wait_vsync = os.environ.get('FB_WAIT_VSYNC', '').lower() in ('true', '1', 'yes')
+
         # Log framebuffer pixel format
         logging.info(f"Framebuffer bits-per-pixel: {self.fb_bpp}")
         # Load configuration
-        display_config = config.get('display', {})
+        # Look each config section up once (a bare 'weather:' key in YAML yields None)
+        display_config = config.get('display') or {}
+        time_config = config.get('time') or {}
+        weather_config = config.get('weather') or {}
         self.color = self.hex_to_rgb(display_config.get('color', '#00FF00'))
         self.bg_color = (0, 0, 0)  # Black background
         
@@ -102,7 +146,6 @@ class FramebufferClock:
         logging.info(f"Font sizes: time={self.time_font_size}, date={self.date_font_size}, weather={self.weather_font_size}, status={self.status_font_size}")
         
         # Time format - check env vars first, then config
-        time_config = config.get('time', {})
         format_12h_env = os.environ.get('TIME_FORMAT_12H', '').lower()
         if format_12h_env in ('true', '1', 'yes'):
             self.format_12h = True
@@ -119,6 +162,11 @@ class FramebufferClock:
         else:
             self.show_seconds = display_config.get('show_seconds', True)
 
+        # Date string is formatted once per day (time is built directly in format_time)
+        self._date_fmt = display_config.get('date_format', "%A, %B %d, %Y")
+        self._date_str = ""
+        self._date_str_day = None
+
         # Auto-shrink time when too wide (env or config; default enabled)
         auto_shrink_env = os.environ.get('AUTO_SHRINK_TIME', '').lower()
         if auto_shrink_env in ('true', '1', 'yes'):
@@ -142,9 +190,16 @@ class FramebufferClock:
         self._sprite_cache = {}
         self._prerender_time_sprites()
         
+        # Composited text cache: (kind, text, color) -> (rgb565, w, h)
+        # Date/status strings repeat for hours; time repeats whenever seconds are hidden.
+        # Bounded by size, not count: a full-width time canvas is ~0.8 MB at 1920x1200
+        self._text_cache = {}
+        self._text_cache_bytes = 0
+        self._text_cache_max_bytes = 8 * 1024 * 1024
+        
         # Status bar configuration
         self.show_status_bar = True
-        self.status_color = tuple(int(c * 0.25) for c in self.color)  # Much dimmer for informational display
+        self.status_color = tuple((c * 64) >> 8 for c in self.color)  # 25% - much dimmer for informational display
         
         # Status bar position - FIXED to avoid artifacts during rotation
         # self.status_bar_positions = ['bottom-left', 'bottom-right', 'top-left', 'top-right']
@@ -153,11 +208,15 @@ class FramebufferClock:
         # self.status_position_interval = 120  # Change position every 2 minutes
         self.status_bar_position = 'bottom-right'  # Fixed position
         self.status_item_regions = []  # [(name, (x,y,w,h))]
+        self._status_segs = {}  # Pre-rendered status segments keyed on content
         
         # Network and sync tracking
         self.last_ntp_sync = None
-        self.network_status = "Unknown"
+        self._set_network_status("Unknown")
+        self._last_full_net_probe = float('-inf')  # time.monotonic() of the last successful probe
         self.timezone_name = os.environ.get('TIMEZONE') or os.environ.get('TZ') or 'UTC'
+        # Static status item - timezone never changes while running
+        self._timezone_item = ("timezone", f"TZ:{self.timezone_name}") if self.timezone_name else None
         self.last_status_check = 0
         
         # Screensaver configuration - check env vars first
@@ -183,6 +242,7 @@ class FramebufferClock:
         self.night_start = int(os.environ.get('NIGHT_START_HOUR', display_config.get('night_start_hour', 22)))
         self.night_end = int(os.environ.get('NIGHT_END_HOUR', display_config.get('night_end_hour', 6)))
         self.current_brightness = 1.0
+        self._effective_colors_key = None
         
         # Pixel shift configuration - check env vars first
         pixel_shift_env = os.environ.get('PIXEL_SHIFT_ENABLED', '').lower()
@@ -195,10 +255,20 @@ class FramebufferClock:
         self.pixel_shift_interval = int(os.environ.get('PIXEL_SHIFT_INTERVAL_SECONDS', display_config.get('pixel_shift_interval_seconds', 30)))  # Shift every 30s for better burn-in protection
         self.pixel_shift_disable_start = int(os.environ.get('PIXEL_SHIFT_DISABLE_START_HOUR', display_config.get('pixel_shift_disable_start_hour', 12)))
         self.pixel_shift_disable_end = int(os.environ.get('PIXEL_SHIFT_DISABLE_END_HOUR', display_config.get('pixel_shift_disable_end_hour', 14)))
-        self.last_pixel_shift = 0
+        # Screensaver/night/shift-pause window membership, cached per hour (see _hour_windows)
+        self._hour_windows_hour = -1
+        self._hour_windows_val = (False, False, False)
+        self.last_pixel_shift = float('-inf')  # time.monotonic() of the last shift
         self.pixel_shift_x = 0
         self.pixel_shift_y = 0
         self.pixel_shift_max = 50  # Increased to ±50px (100px total range) for better burn-in protection
+        # Walk a shuffled 10px grid over the shift range: every offset gets visited once per
+        # cycle, instead of independent random draws clustering and leaving areas untouched
+        grid = range(-self.pixel_shift_max, self.pixel_shift_max + 1, self.PIXEL_SHIFT_GRID_STEP)
+        self._shift_cycle = [(x, y) for x in grid for y in grid]
+        self._shift_rng = random.SystemRandom()
+        self._shift_rng.shuffle(self._shift_cycle)
+        self._shift_idx = 0
         # Track previous shift to detect changes and clear artifacts
         self._prev_pixel_shift_x = 0
         self._prev_pixel_shift_y = 0
@@ -214,7 +284,7 @@ class FramebufferClock:
         
         # Weather service - lazy load only if enabled
         self.weather_service = None
-        weather_enabled = os.environ.get('WEATHER_ENABLED', '').lower() in ('true', '1', 'yes') or config.get('weather', {}).get('enabled', False)
+        weather_enabled = os.environ.get('WEATHER_ENABLED', '').lower() in ('true', '1', 'yes') or weather_config.get('enabled', False)
         if weather_enabled:
             # Lazy import
             global WeatherService
@@ -226,10 +296,10 @@ class FramebufferClock:
                     WeatherService = None
             
             if WeatherService:
-                api_key = os.environ.get('WEATHER_API_KEY') or config.get('weather', {}).get('api_key', '')
-                location = os.environ.get('WEATHER_LOCATION') or config.get('weather', {}).get('location', '')
+                api_key = os.environ.get('WEATHER_API_KEY') or weather_config.get('api_key', '')
+                location = os.environ.get('WEATHER_LOCATION') or weather_config.get('location', '')
                 if api_key and location:
-                    self.weather_service = WeatherService(config.get('weather', {}))
+                    self.weather_service = WeatherService(weather_config)
                     logging.info(f"Weather service enabled for location: {location}")
                 elif not api_key:
                     logging.warning("Weather service disabled: WEATHER_API_KEY not set")
@@ -241,7 +311,7 @@ class FramebufferClock:
         self.weather_text = ""
         
         # Initialize RTC manager only if enabled - lazy load
-        rtc_enabled = os.environ.get('RTC_ENABLED', '').lower() in ('true', '1', 'yes') or config.get('time', {}).get('rtc_enabled', False)
+        rtc_enabled = os.environ.get('RTC_ENABLED', '').lower() in ('true', '1', 'yes') or time_config.get('rtc_enabled', False)
         self.rtc_manager = None
         if rtc_enabled:
             # Lazy import
@@ -261,8 +331,8 @@ class FramebufferClock:
                 except Exception as e:
                     logging.warning(f"RTC initialization failed: {e}")
         
-        # Get initial NTP sync time
-        self.check_last_ntp_sync()
+        # Initial NTP sync time is fetched by the status worker as soon as run() starts;
+        # doing it here could block startup on subprocess timeouts
         
         # Settings state
         self.show_settings_menu = False  # legacy flag (unused)
@@ -276,13 +346,18 @@ class FramebufferClock:
         
         # Log build info
         try:
-            from utils import format_build_info
             logging.info(f"Build info: {format_build_info(self.build_info)}")
         except Exception:
             pass
+        # Static status item - build info is fixed for the life of the process
+        self._version_item = None
+        ver = self.build_info.get("git_version") or ""
+        sha = self.build_info.get("git_sha") or ""
+        short_sha = sha[:7] if isinstance(sha, str) and sha else ""
+        version_str = " ".join(part for part in (ver, short_sha) if part)
+        if version_str:
+            self._version_item = ("version", version_str)
         
-        # Date tracking for optimization
-        self._last_date_sent = None
         logging.info("Framebuffer clock initialized")
     
     def get_framebuffer_size(self):
@@ -291,7 +366,7 @@ class FramebufferClock:
             with open('/sys/class/graphics/fb0/virtual_size', 'r') as f:
                 w, h = f.read().strip().split(',')
                 return int(w), int(h)
-        except:
+        except (OSError, ValueError):
             # Fallback to common size
             return 1920, 1200
     
@@ -374,6 +449,29 @@ class FramebufferClock:
         except Exception:
             self._font_cache = {}
     
+    def _get_time_font(self, size: int):
+        """Return the time font at the given size, loading from the resolved font path once per size."""
+        font = self._font_cache.get(size)
+        if font is None:
+            font = ImageFont.truetype(self.font_file, size)
+            self._font_cache[size] = font
+        return font
+    
+    def _glyph_canvas(self, font, char: str, pad: int, font_size: int):
+        """Size a glyph rasterization canvas from the font's own metrics.
+        Returns (width, height, anchor_x, anchor_y). Rasterizing onto a tight canvas
+        instead of a 4x-font-size square cuts the pixels PIL has to allocate, fill and
+        scan per glyph by an order of magnitude; the cropped sprite is identical.
+        Falls back to the old 4x square if the font can't report anchored metrics.
+        """
+        try:
+            bx0, by0, bx1, by1 = font.getbbox(char, anchor='mm')
+            margin = pad + 4
+            return (bx1 - bx0) + 2 * margin, (by1 - by0) + 2 * margin, margin - bx0, margin - by0
+        except Exception:
+            large_size = int(font_size * 4)
+            return large_size, large_size, large_size // 2, large_size // 2
+    
     def _prerender_time_sprites(self):
         """Pre-render time characters as sprites for fast compositing.
         Date sprites are lazy-loaded on first use to reduce startup time.
@@ -382,7 +480,7 @@ class FramebufferClock:
         Startup only pre-renders 14 time chars (~500ms), date chars loaded as needed.
         """
         logging.info("Pre-rendering time sprite cache (lazy-loading date sprites)...")
-        t_start = time.time()
+        t_start = time.monotonic()
         
         # Characters needed for time display (pre-render at startup)
         chars = '0123456789: AMP'
@@ -407,18 +505,19 @@ class FramebufferClock:
                     'height': self.time_font_size,
                     'baseline_offset': 0,
                     'y_offset': 0,  # Track top offset for alignment
-                    'font': 'time'
+                    'font': 'time',
+                    'blank': True
                 }
                 continue
             
-            # Render on VERY large canvas to capture everything (especially wide chars like M)
-            large_size = int(self.time_font_size * 4)
-            temp_img = Image.new('RGB', (large_size, large_size), (0, 0, 0))
+            # Render on a canvas just large enough for the glyph plus crop padding
+            pad = 8
+            canvas_w, canvas_h, center_x, center = self._glyph_canvas(self.time_font, char, pad, self.time_font_size)
+            temp_img = Image.new('RGB', (canvas_w, canvas_h), (0, 0, 0))
             temp_draw_img = ImageDraw.Draw(temp_img)
             
-            # Render at center of canvas
-            center = large_size // 2
-            temp_draw_img.text((center, center), char, 
+            # Render at the anchor point of the canvas
+            temp_draw_img.text((center_x, center), char, 
                              font=self.time_font, fill=self.color, anchor='mm')
             
             # Find actual pixel bounds
@@ -428,11 +527,10 @@ class FramebufferClock:
                 continue
             
             # Crop to actual content + padding for antialiasing
-            pad = 8
             x0 = max(0, bbox[0] - pad)
             y0 = max(0, bbox[1] - pad)
-            x1 = min(large_size, bbox[2] + pad)
-            y1 = min(large_size, bbox[3] + pad)
+            x1 = min(canvas_w, bbox[2] + pad)
+            y1 = min(canvas_h, bbox[3] + pad)
             
             sprite = temp_img.crop((x0, y0, x1, y1))
             sprite_w = sprite.width
@@ -459,7 +557,34 @@ class FramebufferClock:
                 'font': 'time'
             }
         
-        elapsed = (time.time() - t_start) * 1000
+        # Tabular digits: centre every digit in a slot as wide as the widest one, so a
+        # narrow '1' no longer re-centres the whole string each second - only the slots
+        # whose digit changed differ from the previous frame
+        digit_sprites = [self._sprite_cache[c] for c in '0123456789' if c in self._sprite_cache]
+        slot_w = max([0] + [s['width'] for s in digit_sprites])
+        for sprite_info in digit_sprites:
+            sw = sprite_info['width']
+            if sw >= slot_w:
+                continue
+            left = (slot_w - sw) // 2
+            padded = np.zeros((sprite_info['height'], slot_w), dtype=np.uint16)
+            padded[:, left:left + sw] = sprite_info['rgb565']
+            padded_img = Image.new('RGB', (slot_w, sprite_info['height']), (0, 0, 0))
+            padded_img.paste(sprite_info['image'], (left, 0))
+            sprite_info['rgb565'] = padded
+            sprite_info['image'] = padded_img
+            sprite_info['width'] = slot_w
+        
+        # Atlas metrics: fixed vertical extent across every time glyph so the
+        # composited canvas never changes height from one second to the next
+        time_sprites = [self._sprite_cache[c] for c in chars if c in self._sprite_cache and not self._sprite_cache[c].get('blank')]
+        self._time_atlas_top = min([0] + [s['y_offset'] for s in time_sprites])
+        self._time_atlas_height = max([0] + [s['y_offset'] + s['height'] for s in time_sprites]) - self._time_atlas_top
+        # Widest possible string: digits are all one width now, so only AM vs PM matters
+        self._time_canvas_width = max(sum(self._sprite_cache[c]['width'] for c in template if c in self._sprite_cache)
+                                      for template in ("10:00:00 AM", "10:00:00 PM"))
+        
+        elapsed = (time.monotonic() - t_start) * 1000
         logging.info(f"✓ Time sprite cache complete: {len(self._sprite_cache)} sprites in {elapsed:.1f}ms")
         logging.info(f"  Date sprites will be lazy-loaded on first use")
     
@@ -489,13 +614,13 @@ class FramebufferClock:
             }
             return self._sprite_cache[cache_key]
         
-        # Render on large canvas
-        large_size = int(self.date_font_size * 4)
-        temp_img = Image.new('RGB', (large_size, large_size), (0, 0, 0))
+        # Render on a canvas just large enough for the glyph plus crop padding
+        pad = 5
+        canvas_w, canvas_h, center_x, center = self._glyph_canvas(self.date_font, char, pad, self.date_font_size)
+        temp_img = Image.new('RGB', (canvas_w, canvas_h), (0, 0, 0))
         temp_draw_img = ImageDraw.Draw(temp_img)
         
-        center = large_size // 2
-        temp_draw_img.text((center, center), char,
+        temp_draw_img.text((center_x, center), char,
                          font=self.date_font, fill=self.color, anchor='mm')
         
         bbox = temp_img.getbbox()
@@ -514,11 +639,10 @@ class FramebufferClock:
             }
             return self._sprite_cache[cache_key]
         
-        pad = 5
         x0 = max(0, bbox[0] - pad)
         y0 = max(0, bbox[1] - pad)
-        x1 = min(large_size, bbox[2] + pad)
-        y1 = min(large_size, bbox[3] + pad)
+        x1 = min(canvas_w, bbox[2] + pad)
+        y1 = min(canvas_h, bbox[3] + pad)
         
         sprite = temp_img.crop((x0, y0, x1, y1))
         sprite_w = sprite.width
@@ -545,6 +669,34 @@ class FramebufferClock:
         
         return self._sprite_cache[cache_key]
     
+    def _tint_factor(self, color: tuple) -> float:
+        """Brightness factor of color relative to the configured display color.
+        Uses the brightest channel so pure green/blue colors dim too.
+        """
+        base = max(self.color)
+        return max(color) / base if base else 1.0
+
+    def _tinted_rgb565(self, sprite_info: dict, factor: float) -> np.ndarray:
+        """Return the sprite's RGB565 pixels scaled by factor.
+        The dimmed copy is kept on the sprite until the brightness level changes,
+        so compositing is a plain copy on every frame in between.
+        """
+        sprite_data = sprite_info['rgb565']
+        if factor == 1.0:
+            return sprite_data
+        tinted = sprite_info.get('tinted')
+        if tinted is None or tinted[0] != factor:
+            # Extract RGB components, apply brightness, recombine
+            r = ((sprite_data >> 11) & 0x1F)
+            g = ((sprite_data >> 5) & 0x3F)
+            b = (sprite_data & 0x1F)
+            r = (r * factor).astype(np.uint16).clip(0, 31)
+            g = (g * factor).astype(np.uint16).clip(0, 63)
+            b = (b * factor).astype(np.uint16).clip(0, 31)
+            tinted = (factor, (r << 11) | (g << 5) | b)
+            sprite_info['tinted'] = tinted
+        return tinted[1]
+
     def _composite_time_from_cache(self, time_str: str, color: tuple):
         """Composite time string from pre-rendered sprite cache.
         Returns (rgb565_array, width, height) tuple for ultra-fast blitting.
@@ -554,39 +706,21 @@ class FramebufferClock:
             logging.debug(f"Cache composite skipped: time_str='{time_str}', cache_size={len(self._sprite_cache)}")
             return None
         
-        # Calculate total width and max height
+        # Look up glyphs in the atlas
         total_width = 0
-        max_height = 0
         sprites_to_use = []
         
         for char in time_str:
-            if char not in self._sprite_cache:
+            sprite_info = self._sprite_cache.get(char)
+            if sprite_info is None:
                 logging.warning(f"Sprite cache MISS for char='{char}' (ord={ord(char)}, time_str='{time_str}')")
                 return None
-            sprite_info = self._sprite_cache[char]
             sprites_to_use.append(sprite_info)
             total_width += sprite_info['width']
-            max_height = max(max_height, sprite_info['height'])
-        
-        # Find the minimum y_offset (highest top) to determine canvas height
-        min_y_offset = 0
-        max_bottom_offset = 0
-        for sprite_info in sprites_to_use:
-            y_off = sprite_info.get('y_offset', 0)
-            min_y_offset = min(min_y_offset, y_off)
-            max_bottom_offset = max(max_bottom_offset, y_off + sprite_info['height'])
-        
-        # Canvas height to fit all sprites aligned to common baseline
-        canvas_height = max_bottom_offset - min_y_offset
-        
-        # Use FIXED canvas width
-        if not hasattr(self, '_time_canvas_width'):
-            max_width = 0
-            for char in "10:00:00 PM":
-                if char in self._sprite_cache:
-                    max_width += self._sprite_cache[char]['width']
-            self._time_canvas_width = max_width
         
+        # Canvas height and baseline come from precomputed atlas metrics
+        min_y_offset = self._time_atlas_top
+        canvas_height = self._time_atlas_height
         canvas_width = self._time_canvas_width
         
         # Ensure canvas is wide enough for current time string
@@ -604,9 +738,8 @@ class FramebufferClock:
         # Create RGB565 canvas directly (no PIL Image intermediate)
         canvas_rgb565 = np.zeros((canvas_height, canvas_width), dtype=np.uint16)
         
-        # Check if we need brightness adjustment
-        needs_tint = color != self.color
-        brightness_factor = color[0] / max(1, self.color[0]) if self.color[0] > 0 else 1.0
+        # Brightness is applied per glyph via the tinted atlas
+        brightness_factor = self._tint_factor(color)
         
         # Blit each sprite (use pre-converted RGB565 data)
         x_offset = x_start
@@ -615,19 +748,13 @@ class FramebufferClock:
             sh = sprite_info['height']
             y_off = sprite_info.get('y_offset', 0) - min_y_offset
             
-            # Use pre-converted RGB565 data
-            sprite_data = sprite_info['rgb565']
+            # Blank glyphs (space) only advance the cursor - canvas is already zeroed
+            if sprite_info.get('blank'):
+                x_offset += sw
+                continue
             
-            # Apply brightness if needed (adjust RGB565 values)
-            if needs_tint and brightness_factor != 1.0:
-                # Extract RGB components, apply brightness, recombine
-                r = ((sprite_data >> 11) & 0x1F)
-                g = ((sprite_data >> 5) & 0x3F)
-                b = (sprite_data & 0x1F)
-                r = (r * brightness_factor).astype(np.uint16).clip(0, 31)
-                g = (g * brightness_factor).astype(np.uint16).clip(0, 63)
-                b = (b * brightness_factor).astype(np.uint16).clip(0, 31)
-                sprite_data = (r << 11) | (g << 5) | b
+            # Use pre-converted RGB565 data (already dimmed for the current brightness)
+            sprite_data = self._tinted_rgb565(sprite_info, brightness_factor)
             
             # Bounds check: ensure sprite fits within canvas
             if x_offset + sw > canvas_width:
@@ -719,9 +846,8 @@ class FramebufferClock:
         # Create RGB565 canvas directly
         canvas_rgb565 = np.zeros((canvas_height, canvas_width), dtype=np.uint16)
         
-        # Apply brightness if needed
-        needs_tint = color != self.color
-        brightness_factor = color[0] / max(1, self.color[0]) if self.color[0] > 0 else 1.0
+        # Brightness is applied per glyph via the tinted atlas
+        brightness_factor = self._tint_factor(color)
         
         x_offset = x_start
         for sprite_info in sprites_to_use:
@@ -729,18 +855,8 @@ class FramebufferClock:
             sh = sprite_info['height']
             y_off = sprite_info.get('y_offset', 0) - min_y_offset
             
-            # Use pre-converted RGB565 data
-            sprite_data = sprite_info['rgb565']
-            
-            # Apply brightness if needed
-            if needs_tint and brightness_factor != 1.0:
-                r = ((sprite_data >> 11) & 0x1F)
-                g = ((sprite_data >> 5) & 0x3F)
-                b = (sprite_data & 0x1F)
-                r = (r * brightness_factor).astype(np.uint16).clip(0, 31)
-                g = (g * brightness_factor).astype(np.uint16).clip(0, 63)
-                b = (b * brightness_factor).astype(np.uint16).clip(0, 31)
-                sprite_data = (r << 11) | (g << 5) | b
+            # Use pre-converted RGB565 data (already dimmed for the current brightness)
+            sprite_data = self._tinted_rgb565(sprite_info, brightness_factor)
             
             # Bounds check: ensure sprite fits within canvas
             if x_offset + sw > canvas_width:
@@ -774,10 +890,48 @@ class FramebufferClock:
         
         return (canvas_rgb565, canvas_width, canvas_height)
 
+    def _cached_composite(self, kind: str, text: str, color: tuple):
+        """Return composited RGB565 for text, reusing a previous result when possible.
+        kind is 'time' or 'date'. Cache is bounded by total bytes with simple FIFO eviction.
+        """
+        key = (kind, text, color)
+        result = self._text_cache.get(key)
+        if result is not None:
+            return result
+        if kind == 'time':
+            result = self._composite_time_from_cache(text, color)
+        else:
+            result = self._composite_date_from_cache(text, color)
+        if result is None:
+            return None
+        size = result[0].nbytes
+        while self._text_cache and self._text_cache_bytes + size > self._text_cache_max_bytes:
+            # dicts preserve insertion order - drop the oldest entry
+            evicted = self._text_cache.pop(next(iter(self._text_cache)))
+            self._text_cache_bytes -= evicted[0].nbytes
+        self._text_cache[key] = result
+        self._text_cache_bytes += size
+        return result
+
+    def _image_to_rgb565(self, img: Image.Image) -> np.ndarray:
+        """Convert an RGB888 PIL image to a 2D RGB565 array (framebuffer pixel format)."""
+        arr = np.frombuffer(img.convert('RGB').tobytes(), dtype=np.uint8).reshape((img.height, img.width, 3))
+        r = (arr[:, :, 0] >> 3).astype(np.uint16)
+        g = (arr[:, :, 1] >> 2).astype(np.uint16)
+        b = (arr[:, :, 2] >> 3).astype(np.uint16)
+        return (r << 11) | (g << 5) | b
+
     def hex_to_rgb(self, hex_color):
-        """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        """Convert hex color to RGB tuple (falls back to green if the value isn't #RRGGBB)."""
+        rgb = None
+        try:
+            rgb = tuple(bytes.fromhex(str(hex_color).lstrip('#')))
+        except ValueError:
+            pass
+        if rgb is None or len(rgb) != 3:
+            logging.warning(f"Invalid color '{hex_color}', expected #RRGGBB - using #00FF00")
+            return (0, 255, 0)
+        return rgb
 
     def _draw_icon(self, draw, x, y, icon_type, color):
         """Draw a tiny bitmap icon (10x10) for status items."""
@@ -807,41 +961,85 @@ class FramebufferClock:
             draw.line([x+1, y+5, x+3, y+5], fill=color)
             draw.line([x+7, y+5, x+9, y+5], fill=color)
 
+    def _text_bbox(self, text, font):
+        """textbbox() memoized per (font, text) - status labels repeat constantly."""
+        key = (id(font), text)
+        bbox = self._bbox_cache.get(key)
+        if bbox is None:
+            if len(self._bbox_cache) > 1024:
+                self._bbox_cache.clear()
+            bbox = self._temp_draw.textbbox((0,0), text, font=font)
+            self._bbox_cache[key] = bbox
+        return bbox
+
+    def _status_segment(self, name, label, status_color, seg_h, text_y, sep=False):
+        """Return a cached pre-rendered status bar segment (icon + label, or separator).
+        Segments are keyed on their own content, so a change in one item (e.g. the
+        sync time) only re-renders that item; network/timezone/version are reused.
+        The key includes the (brightness-adjusted) color, so day and night variants
+        of the icons both stay cached; eviction is least-recently-used so only
+        stale labels (old sync times) fall out.
+        """
+        key = (name, label, status_color, seg_h, text_y, sep)
+        seg = self._status_segs.pop(key, None)
+        if seg is not None:
+            self._status_segs[key] = seg  # re-insert as most recently used
+            return seg
+        if len(self._status_segs) >= 64:
+            # dicts preserve insertion order - drop the least recently used entry
+            self._status_segs.pop(next(iter(self._status_segs)))
+        icon_w = 12 if (not sep and name in self.STATUS_ICON_NAMES) else 0
+        lb = self._text_bbox(label, self.status_font)
+        seg_w = icon_w + (lb[2] - lb[0])
+        seg = Image.new('RGB', (max(1, seg_w), seg_h), (0,0,0))
+        seg_draw = ImageDraw.Draw(seg)
+        if sep:
+            seg_draw.text((0, 0), label, font=self.status_font, fill=status_color)
+        else:
+            if icon_w:
+                self._draw_icon(seg_draw, 0, text_y, name, status_color)
+            seg_draw.text((icon_w, text_y), label, font=self.status_font, fill=status_color)
+        self._status_segs[key] = seg
+        return seg
+
     def _render_status_bar(self, status_items, status_color, margin):
         """Render status bar with icons and text. Caches result and only redraws when changed."""
         if not status_items:
             return
         
-        # Simple time-based cache: only re-render status bar once per minute
-        # This avoids expensive renders for sync time text that changes every second
-        current_minute = time.time() // 60
-        if hasattr(self, '_status_last_minute') and self._status_last_minute == current_minute:
-            # Use cached status bar from this minute
-            if hasattr(self, '_status_cached_img') and hasattr(self, '_status_cached_pos'):
-                status_img = self._status_cached_img
-                status_x, status_y = self._status_cached_pos
-                self.blit_rgb_image(status_img, status_x, status_y, clear_last_rect_attr='_last_status_rect', skip_write=True)
-                logging.info(f"Status cache HIT (min={current_minute})")
-                return
+        # Content-keyed cache: re-render only when a label, the color or the margin changes
+        status_key = (tuple(status_items), status_color, margin)
+        if status_key == getattr(self, '_status_cache_key', None):
+            status_x, status_y = self._status_cached_pos
+            if self._status_cached_rgb565 is not None:
+                # Already in framebuffer pixel format - no per-frame conversion
+                self.blit_rgb565_direct(self._status_cached_rgb565, status_x, status_y, clear_last_rect_attr='_last_status_rect', skip_write=True)
+            else:
+                self.blit_rgb_image(self._status_cached_img, status_x, status_y, clear_last_rect_attr='_last_status_rect', skip_write=True)
+            logging.debug("Status cache HIT")
+            return
         
-        logging.info(f"Status cache MISS - rendering (min={current_minute})")
+        logging.debug("Status cache MISS - rendering")
         
         position_name = self.status_bar_position  # Use fixed position
         
         # Calculate dimensions
+        sep_label = " | "
+        sep_bbox = self._text_bbox(sep_label, self.status_font)
+        sep_w = sep_bbox[2] - sep_bbox[0]
         status_w = 0
         status_h = 0
         min_y_offset = 0
+        item_sizes = []
         for idx, (name, label) in enumerate(status_items):
-            if name in ['network', 'error', 'sync_ok', 'sync_old', 'settings']:
-                status_w += 12
-            lb = self._temp_draw.textbbox((0,0), label, font=self.status_font)
-            status_w += lb[2] - lb[0]
+            icon_w = 12 if name in self.STATUS_ICON_NAMES else 0
+            lb = self._text_bbox(label, self.status_font)
+            item_sizes.append((icon_w + (lb[2] - lb[0]), lb[3] - lb[1]))
+            status_w += item_sizes[-1][0]
             status_h = max(status_h, lb[3] - lb[1])
             min_y_offset = min(min_y_offset, lb[1])
             if idx < len(status_items) - 1:
-                sep = self._temp_draw.textbbox((0,0), " | ", font=self.status_font)
-                status_w += sep[2] - sep[0]
+                status_w += sep_w
         
         v_pad = max(5, -min_y_offset + 3)
         status_h += v_pad
@@ -860,42 +1058,31 @@ class FramebufferClock:
             status_x = self.fb_width - status_w - margin
             status_y = margin
         
-        # Render status bar
+        # Compose status bar from cached segments and build clickable regions
         status_img = Image.new('RGB', (status_w, status_h), (0,0,0))
-        status_draw = ImageDraw.Draw(status_img)
-        cursor_x = 0
         text_y = -min_y_offset if min_y_offset < 0 else 0
-        for idx, (name, label) in enumerate(status_items):
-            if name in ['network', 'error', 'sync_ok', 'sync_old', 'settings']:
-                self._draw_icon(status_draw, cursor_x, text_y, name, status_color)
-                cursor_x += 12
-            status_draw.text((cursor_x, text_y), label, font=self.status_font, fill=status_color)
-            lb = self._temp_draw.textbbox((0,0), label, font=self.status_font)
-            cursor_x += lb[2] - lb[0]
-            if idx < len(status_items) - 1:
-                status_draw.text((cursor_x, 0), " | ", font=self.status_font, fill=status_color)
-                sep = self._temp_draw.textbbox((0,0), " | ", font=self.status_font)
-                cursor_x += sep[2] - sep[0]
-        
-        # Build clickable regions
         self.status_item_regions = []
-        cursor_rel_x = 0
+        cursor_x = 0
         for idx, (name, label) in enumerate(status_items):
-            icon_w = 12 if name in ['network', 'error', 'sync_ok', 'sync_old', 'settings'] else 0
-            lb = self._temp_draw.textbbox((0,0), label, font=self.status_font)
-            iw = icon_w + (lb[2] - lb[0])
-            ih = lb[3] - lb[1]
-            self.status_item_regions.append((name, (status_x + cursor_rel_x, status_y, iw, ih)))
-            cursor_rel_x += iw
+            iw, ih = item_sizes[idx]
+            status_img.paste(self._status_segment(name, label, status_color, status_h, text_y), (cursor_x, 0))
+            self.status_item_regions.append((name, (status_x + cursor_x, status_y, iw, ih)))
+            cursor_x += iw
             if idx < len(status_items) - 1:
-                sep = self._temp_draw.textbbox((0,0), " | ", font=self.status_font)
-                cursor_rel_x += sep[2] - sep[0]
+                status_img.paste(self._status_segment('sep', sep_label, status_color, status_h, text_y, sep=True), (cursor_x, 0))
+                cursor_x += sep_w
         
-        self.blit_rgb_image(status_img, status_x, status_y, clear_last_rect_attr='_last_status_rect', skip_write=True)
+        # Convert once to framebuffer format; cache hits reuse the converted pixels
+        status_rgb565 = self._image_to_rgb565(status_img) if self.fb_bpp == 16 else None
+        if status_rgb565 is not None:
+            self.blit_rgb565_direct(status_rgb565, status_x, status_y, clear_last_rect_attr='_last_status_rect', skip_write=True)
+        else:
+            self.blit_rgb_image(status_img, status_x, status_y, clear_last_rect_attr='_last_status_rect', skip_write=True)
         
-        # Cache the rendered status bar with minute timestamp
-        self._status_last_minute = current_minute
+        # Cache the rendered status bar keyed on its content
+        self._status_cache_key = status_key
         self._status_cached_img = status_img
+        self._status_cached_rgb565 = status_rgb565
         self._status_cached_pos = (status_x, status_y)
 
     # ------------------------
@@ -903,6 +1090,7 @@ class FramebufferClock:
     # ------------------------
     def _init_input_devices(self):
         self.input_devices = []
+        self._absinfo_cache = {}
         try:
             if InputDevice is None:
                 logging.info("evdev not available; input disabled")
@@ -923,48 +1111,93 @@ class FramebufferClock:
         except Exception as e:
             logging.warning(f"Failed to init input devices: {e}")
 
+    def _abs_range(self, dev, code):
+        """Return cached (min, range) for an absolute axis - avoids an ioctl per event."""
+        key = (dev.path, code)
+        rng = self._absinfo_cache.get(key)
+        if rng is None:
+            ai = dev.absinfo(code)
+            rng = (ai.min, max(1, ai.max - ai.min))
+            self._absinfo_cache[key] = rng
+        return rng
+
+    def _apply_abs_position(self, dev, last_x, last_y):
+        """Scale the latest raw absolute (code, value) readings to framebuffer pointer coordinates."""
+        try:
+            if last_x is not None:
+                amin, rng = self._abs_range(dev, last_x[0])
+                self.pointer_x = int((last_x[1] - amin) * (self.fb_width - 1) / rng)
+            if last_y is not None:
+                amin, rng = self._abs_range(dev, last_y[0])
+                self.pointer_y = int((last_y[1] - amin) * (self.fb_height - 1) / rng)
+        except Exception:
+            pass
+
     def _poll_input(self):
         if not self.input_devices or ecodes is None:
             return
-        for dev in list(self.input_devices):
+        # Only touch devices that actually have pending events (no BlockingIOError per idle device)
+        try:
+            ready, _, _ = select.select(self.input_devices, [], [], 0)
+        except Exception as e:
+            logging.debug(f"Input select error: {e}")
+            return
+        # Resolve event codes once per poll rather than per event
+        ev_abs, ev_rel, ev_key = ecodes.EV_ABS, ecodes.EV_REL, ecodes.EV_KEY
+        abs_x, abs_y = ecodes.ABS_X, ecodes.ABS_Y
+        mt_x = getattr(ecodes, 'ABS_MT_POSITION_X', 0)
+        mt_y = getattr(ecodes, 'ABS_MT_POSITION_Y', 1)
+        tap_codes = (getattr(ecodes, 'BTN_TOUCH', 0x14a), getattr(ecodes, 'BTN_LEFT', 0x110))
+        for dev in ready:
             try:
+                # A drag queues dozens of ABS moves per read; only the newest position matters,
+                # so keep the raw (code, value) and scale it once per batch (or before a tap)
+                last_x = last_y = None
                 for event in dev.read_many():
-                    if event.type == ecodes.EV_ABS:
-                        if event.code == ecodes.ABS_X:
-                            ai = dev.absinfo(ecodes.ABS_X)
-                            rng = max(1, ai.max - ai.min)
-                            self.pointer_x = int((event.value - ai.min) * (self.fb_width - 1) / rng)
-                        elif event.code == ecodes.ABS_Y:
-                            ai = dev.absinfo(ecodes.ABS_Y)
-                            rng = max(1, ai.max - ai.min)
-                            self.pointer_y = int((event.value - ai.min) * (self.fb_height - 1) / rng)
-                        elif event.code in (getattr(ecodes, 'ABS_MT_POSITION_X', 0), getattr(ecodes, 'ABS_MT_POSITION_Y', 1)):
-                            try:
-                                ai = dev.absinfo(event.code)
-                                rng = max(1, ai.max - ai.min)
-                                if event.code == getattr(ecodes, 'ABS_MT_POSITION_X', 0):
-                                    self.pointer_x = int((event.value - ai.min) * (self.fb_width - 1) / rng)
-                                else:
-                                    self.pointer_y = int((event.value - ai.min) * (self.fb_height - 1) / rng)
-                            except Exception:
-                                pass
-                    elif event.type == ecodes.EV_REL:
+                    etype = event.type
+                    if etype == ev_abs:
+                        code = event.code
+                        if code == abs_x or code == mt_x:
+                            last_x = (code, event.value)
+                        elif code == abs_y or code == mt_y:
+                            last_y = (code, event.value)
+                    elif etype == ev_rel:
                         if event.code == ecodes.REL_X:
                             self.pointer_x = max(0, min(self.fb_width - 1, self.pointer_x + event.value))
                         elif event.code == ecodes.REL_Y:
                             self.pointer_y = max(0, min(self.fb_height - 1, self.pointer_y + event.value))
-                    elif event.type == ecodes.EV_KEY:
-                        if event.code in (getattr(ecodes, 'BTN_TOUCH', 0x14a), getattr(ecodes, 'BTN_LEFT', 0x110)):
+                    elif etype == ev_key:
+                        if event.code in tap_codes:
                             if event.value == 1:
                                 self.pointer_down = True
                             elif event.value == 0 and self.pointer_down:
                                 self.pointer_down = False
+                                self._apply_abs_position(dev, last_x, last_y)
+                                last_x = last_y = None
                                 self._handle_tap(self.pointer_x, self.pointer_y)
+                    # EV_SYN/EV_MSC and anything else: nothing to do
+                self._apply_abs_position(dev, last_x, last_y)
             except BlockingIOError:
                 continue
+            except OSError as e:
+                # Unplugged device (ENODEV): its fd stays readable forever and would turn
+                # the select() nap into a busy loop - drop it
+                logging.warning(f"Input device {getattr(dev, 'path', dev)} removed: {e}")
+                self._drop_input_device(dev)
             except Exception as e:
                 logging.debug(f"Input read error: {e}")
 
+    def _drop_input_device(self, dev):
+        """Close a dead input device and stop selecting on it."""
+        try:
+            self.input_devices.remove(dev)
+        except ValueError:
+            pass
+        try:
+            dev.close()
+        except Exception:
+            pass
+
     def _handle_tap(self, x, y):
         if self.show_settings_overlay:
             for name, rect, cb in list(self.overlay_buttons):
@@ -1000,7 +1233,51 @@ class FramebufferClock:
         ty = y + (h - th) // 2
         draw.text((tx, ty), label, font=self.status_font, fill=(200,200,200))
 
-    def _render_settings_overlay(self):
+    def _overlay_state_key(self, now: Optional[datetime] = None):
+        """Everything the settings overlay shows - it only needs redrawing when this changes."""
+        return (self.active_settings_tab, self.show_seconds, self.dim_at_night, self.pixel_shift_enabled,
+                self.status_color, self.format_12h, getattr(self, 'status_position_interval', None),
+                self.network_status, self.get_time_since_sync(now))
+
+    def _render_settings_overlay(self, overlay_key=None):
+        """Blit the settings overlay, redrawing it only when overlay_key (see _overlay_state_key) changed."""
+        if overlay_key is None:
+            overlay_key = self._overlay_state_key()
+        if overlay_key != getattr(self, '_overlay_cache_key', None):
+            self._overlay_cached_img = self._draw_settings_overlay()
+            self._overlay_cached_rgb565 = self._image_to_rgb565(self._overlay_cached_img) if self.fb_bpp == 16 else None
+            self._overlay_cache_key = overlay_key
+        if self._overlay_cached_rgb565 is not None:
+            self.blit_rgb565_direct(self._overlay_cached_rgb565, 0, 0, clear_last_rect_attr='_last_overlay_rect', skip_write=True)
+        else:
+            self.blit_rgb_image(self._overlay_cached_img, 0, 0, clear_last_rect_attr='_last_overlay_rect', skip_write=True)
+        # Overlay covers everything underneath - force a full redraw once it closes
+        self._blit_sources.clear()
+        self._needs_full_clear = True
+        # The old cursor position was just painted over, so don't clear it (would punch a hole)
+        self._last_cursor_rect = None
+
+    def _render_cursor(self):
+        """Draw the pointer cursor (only when touch/mouse input is present)."""
+        if not getattr(self, 'input_devices', None):
+            return
+        cur_size = 8
+        if getattr(self, '_cursor_img', None) is None:
+            # Cursor never changes - draw and convert it to RGB565 once
+            cur_img = Image.new('RGB', (cur_size, cur_size), (0,0,0))
+            cd = ImageDraw.Draw(cur_img)
+            cd.ellipse((1,1,cur_size-2,cur_size-2), outline=(255,255,255))
+            self._cursor_img = cur_img
+            self._cursor_rgb565 = self._image_to_rgb565(cur_img) if self.fb_bpp == 16 else None
+        px = max(0, min(self.fb_width - cur_size, self.pointer_x))
+        py = max(0, min(self.fb_height - cur_size, self.pointer_y))
+        if self._cursor_rgb565 is not None:
+            self.blit_rgb565_direct(self._cursor_rgb565, px, py, clear_last_rect_attr='_last_cursor_rect', skip_write=True)
+        else:
+            self.blit_rgb_image(self._cursor_img, px, py, clear_last_rect_attr='_last_cursor_rect', skip_write=True)
+
+    def _draw_settings_overlay(self):
+        """Draw the settings panel and register its buttons (called only when its content changes)."""
         overlay = Image.new('RGB', (self.fb_width, self.fb_height), (0,0,0))
         d = ImageDraw.Draw(overlay)
         panel_margin = 40
@@ -1024,7 +1301,7 @@ class FramebufferClock:
         cy1 = self.fb_height - panel_margin - 20
         d.rectangle([cx0, cy0, cx1, cy1], outline=(60,60,60))
         self._render_tab_content(d, cx0+20, cy0+20, cx1-20, cy1-20)
-        self.blit_rgb_image(overlay, 0, 0)
+        return overlay
 
     def _set_active_tab(self, t):
         self.active_settings_tab = t
@@ -1085,37 +1362,32 @@ class FramebufferClock:
             d.text((x0, y), f"Sync: {self.get_time_since_sync()}", font=self.status_font, fill=(160,160,160))
         else:
             try:
-                from utils import format_build_info
                 d.text((x0, y), format_build_info(self.build_info), font=self.status_font, fill=(160,160,160))
             except Exception:
                 d.text((x0, y), "Version info unavailable", font=self.status_font, fill=(160,160,160))
     
     def format_time(self, now):
-        """Format time string."""
+        """Format time string.
+        Built from the integer fields rather than strftime: no format parsing or locale
+        lookup, no glibc-only %-I, and AM/PM always matches the pre-rendered sprites.
+        """
+        hour = now.hour
         if self.format_12h:
+            suffix = 'AM' if hour < 12 else 'PM'
             if self.show_seconds:
-                # Prefer Linux-specific %-I to suppress leading zero; fallback if unsupported
-                try:
-                    return now.strftime("%-I:%M:%S %p")
-                except Exception:
-                    s = now.strftime("%I:%M:%S %p")
-                    return s.lstrip('0') if s.startswith('0') else s
-            else:
-                try:
-                    return now.strftime("%-I:%M %p")
-                except Exception:
-                    s = now.strftime("%I:%M %p")
-                    return s.lstrip('0') if s.startswith('0') else s
-        else:
-            if self.show_seconds:
-                return now.strftime("%H:%M:%S")
-            else:
-                return now.strftime("%H:%M")
+                return f"{hour % 12 or 12}:{now.minute:02d}:{now.second:02d} {suffix}"
+            return f"{hour % 12 or 12}:{now.minute:02d} {suffix}"
+        if self.show_seconds:
+            return f"{hour:02d}:{now.minute:02d}:{now.second:02d}"
+        return f"{hour:02d}:{now.minute:02d}"
     
     def format_date(self, now):
-        """Format date string."""
-        date_format = self.config.get('display', {}).get('date_format', "%A, %B %d, %Y")
-        return now.strftime(date_format)
+        """Format date string (formatted once per calendar day)."""
+        day = now.toordinal()
+        if day != self._date_str_day:
+            self._date_str = now.strftime(self._date_fmt)
+            self._date_str_day = day
+        return self._date_str
     
     def is_in_time_window(self, current_hour, start_hour, end_hour):
         """Check if current hour is within a time window."""
@@ -1124,71 +1396,188 @@ class FramebufferClock:
         else:
             return current_hour >= start_hour or current_hour < end_hour
     
-    def should_show_display(self):
+    def _hour_windows(self, hour: int):
+        """Return (in_screensaver, in_night, in_shift_pause) for this hour.
+        Every window is whole hours, so this is recomputed once per hour; the enable
+        toggles are checked by the callers since the overlay can flip them at any time.
+        """
+        if hour != self._hour_windows_hour:
+            self._hour_windows_val = (
+                self.is_in_time_window(hour, self.screensaver_start, self.screensaver_end),
+                self.is_in_time_window(hour, self.night_start, self.night_end),
+                self.is_in_time_window(hour, self.pixel_shift_disable_start, self.pixel_shift_disable_end),
+            )
+            self._hour_windows_hour = hour
+        return self._hour_windows_val
+
+    def should_show_display(self, now: Optional[datetime] = None):
         """Check if display should be shown."""
         if not self.screensaver_enabled:
             return True
-        current_hour = datetime.now().hour
-        in_screensaver_window = self.is_in_time_window(current_hour, self.screensaver_start, self.screensaver_end)
-        return not in_screensaver_window
+        return not self._hour_windows((now or datetime.now()).hour)[0]
     
-    def update_brightness(self):
+    def _set_display_blank(self, blank: bool):
+        """Ask the framebuffer driver to blank (power down) or unblank the panel via sysfs.
+        Best effort: the black frame already hides the clock if the driver or container refuses.
+        """
+        path = f"/sys/class/graphics/{os.path.basename(self.fb_device)}/blank"
+        try:
+            with open(path, 'w') as f:
+                f.write('1' if blank else '0')
+            logging.info(f"Display {'blanked' if blank else 'unblanked'} via {path}")
+        except OSError as e:
+            logging.debug(f"Display blank via {path} unavailable: {e}")
+
+    def update_brightness(self, now: Optional[datetime] = None):
         """Update brightness based on time of day."""
         if not self.dim_at_night:
             self.current_brightness = 1.0
             return
-        current_hour = datetime.now().hour
-        if self.is_in_time_window(current_hour, self.night_start, self.night_end):
+        if self._hour_windows((now or datetime.now()).hour)[1]:
             self.current_brightness = self.night_brightness
         else:
             self.current_brightness = 1.0
     
     def apply_brightness(self, color):
-        """Apply current brightness to a color tuple."""
-        return tuple(int(c * self.current_brightness) for c in color)
+        """Apply current brightness to a color tuple (8.8 fixed-point scale, integer math only)."""
+        q = round(self.current_brightness * 256)
+        if q >= 256:
+            return tuple(color)
+        return ((color[0] * q) >> 8, (color[1] * q) >> 8, (color[2] * q) >> 8)
+    
+    def _effective_colors(self):
+        """Return (display_color, status_color) with brightness applied, memoized.
+        Brightness only changes at the night boundary, so this is usually a tuple compare.
+        """
+        key = (self.current_brightness, self.color, self.status_color)
+        if key != self._effective_colors_key:
+            self._effective_colors_val = (self.apply_brightness(self.color), self.apply_brightness(self.status_color))
+            self._effective_colors_key = key
+        return self._effective_colors_val
+
+    def _set_network_status(self, status):
+        """Publish network status and its precomputed status bar item (icon chosen once here)."""
+        icon = "network" if "Connected" in status else "error"
+        self._network_item = (icon, status) if status else None
+        self.network_status = status
+
+    @staticmethod
+    def _link_up() -> Optional[bool]:
+        """Return True if any non-loopback interface reports operstate 'up' (reads sysfs, no fork).
+        Returns None if /sys/class/net can't be read.
+        """
+        try:
+            for entry in os.scandir('/sys/class/net'):
+                if entry.name == 'lo':
+                    continue
+                try:
+                    with open(f'/sys/class/net/{entry.name}/operstate', 'r') as f:
+                        if f.read().strip() == 'up':
+                            return True
+                except OSError:
+                    continue
+        except OSError:
+            return None
+        return False
 
     def check_network_status(self):
         """Check network connectivity."""
+        # No interface up means no network - skip the connect and its 3s timeout
+        link = self._link_up()
+        if link is False:
+            self._set_network_status("No Network")
+            return
+        # Link still up and internet confirmed recently - trust it rather than open a socket;
+        # the full probe runs every 5 minutes or after any transition
+        if (link and self.network_status == "Connected"
+                and time.monotonic() - self._last_full_net_probe < 300):
+            return
         try:
-            socket.create_connection(("8.8.8.8", 53), timeout=3)
-            self.network_status = "Connected"
-        except:
-            self.network_status = "No Network"
+            with socket.create_connection(("8.8.8.8", 53), timeout=3):
+                pass
+            self._set_network_status("Connected")
+            self._last_full_net_probe = time.monotonic()
+        except OSError:
+            self._set_network_status("No Network")
     
+    @staticmethod
+    def _process_running(names) -> bool:
+        """Return True if a process with one of the given names is running (reads /proc, no pgrep fork)."""
+        try:
+            for entry in os.scandir('/proc'):
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{entry.name}/comm', 'r') as f:
+                        if f.read().strip() in names:
+                            return True
+                except OSError:
+                    continue
+        except OSError:
+            pass
+        return False
+
+    @staticmethod
+    def _kernel_clock_synced() -> Optional[bool]:
+        """Query the kernel NTP state via adjtimex(2) - what timedatectl reports, without a fork.
+        Returns None if the call is unavailable.
+        """
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            # struct timex is < 256 bytes on all ABIs; modes=0 (first field) makes this read-only
+            buf = ctypes.create_string_buffer(512)
+            state = libc.adjtimex(buf)
+            if state < 0:
+                return None
+            return state != 5  # TIME_ERROR: clock not synchronized
+        except Exception:
+            return None
+
     def check_last_ntp_sync(self):
         """Check last NTP synchronization time using multiple methods."""
-        # Method 1: Try timedatectl
+        # Method 0: systemd-timesyncd touches this file on every successful sync,
+        # so its mtime is the real last-sync time - a stat() instead of a subprocess
         try:
-            result = subprocess.run(['timedatectl', 'show', '--property=NTPSynchronized', '--value'],
-                                    capture_output=True, text=True, timeout=2)
-            if result.returncode == 0 and result.stdout.strip() == 'yes':
-                self.last_ntp_sync = datetime.now()
-                return
-        except:
+            mtime = os.stat('/run/systemd/timesync/synchronized').st_mtime
+            self.last_ntp_sync = datetime.fromtimestamp(mtime)
+            return
+        except OSError:
             pass
         
-        # Method 2: Check systemd-timesyncd status
-        try:
-            result = subprocess.run(['systemctl', 'status', 'systemd-timesyncd'],
-                                    capture_output=True, text=True, timeout=2)
-            if result.returncode == 0 and 'synchronized' in result.stdout.lower():
-                self.last_ntp_sync = datetime.now()
-                return
-        except:
-            pass
+        # Method 1: Kernel clock state (same source timedatectl uses), then timedatectl itself
+        synced = self._kernel_clock_synced()
+        if synced:
+            self.last_ntp_sync = datetime.now()
+            return
+        if synced is None:
+            # Kernel state unavailable - ask timedatectl (forks a process)
+            try:
+                result = subprocess.run(['timedatectl', 'show', '--property=NTPSynchronized', '--value'],
+                                        capture_output=True, text=True, timeout=2)
+                if result.returncode == 0 and result.stdout.strip() == 'yes':
+                    self.last_ntp_sync = datetime.now()
+                    return
+            except (OSError, subprocess.SubprocessError):
+                pass
+            
+            # Method 2: Check systemd-timesyncd status
+            # (only without kernel state - timesyncd's "synchronized" is that same kernel flag)
+            try:
+                result = subprocess.run(['systemctl', 'status', 'systemd-timesyncd'],
+                                        capture_output=True, text=True, timeout=2)
+                if result.returncode == 0 and 'synchronized' in result.stdout.lower():
+                    self.last_ntp_sync = datetime.now()
+                    return
+            except (OSError, subprocess.SubprocessError):
+                pass
         
         # Method 3: Check if chrony or ntpd is running
-        try:
-            for service in ['chronyd', 'ntpd']:
-                result = subprocess.run(['pgrep', service],
-                                        capture_output=True, timeout=2)
-                if result.returncode == 0:
-                    # Service is running, assume sync happened
-                    if not self.last_ntp_sync:
-                        self.last_ntp_sync = datetime.now()
-                    return
-        except:
-            pass
+        if self._process_running(('chronyd', 'ntpd')):
+            # Service is running, assume sync happened
+            if not self.last_ntp_sync:
+                self.last_ntp_sync = datetime.now()
+            return
         
         # Method 4: Use RTC if available
         if self.rtc_manager and self.rtc_manager.available:
@@ -1203,11 +1592,24 @@ class FramebufferClock:
             self.last_ntp_sync = datetime.now()
             logging.debug("Assumed NTP sync based on network connectivity")
     
-    def get_time_since_sync(self):
-        """Get human-readable time since last NTP sync."""
+    def get_time_since_sync(self, now: Optional[datetime] = None):
+        """Get human-readable time since last NTP sync.
+        Cached per 30-second bucket (and per sync reference) since it is read every frame.
+        now: the caller's wall-clock reading, reused on a cache miss.
+        """
+        bucket = int(time.time()) // 30
+        cached = getattr(self, '_sync_str_cache', None)
+        if cached and cached[0] == bucket and cached[1] is self.last_ntp_sync:
+            return cached[2]
+        label = self._compute_time_since_sync(now)
+        self._sync_str_cache = (bucket, self.last_ntp_sync, label)
+        return label
+    
+    def _compute_time_since_sync(self, now: Optional[datetime] = None):
+        """Compute the time-since-sync label from last_ntp_sync."""
         if not self.last_ntp_sync:
             return "Never"
-        delta = datetime.now() - self.last_ntp_sync
+        delta = (now or datetime.now()) - self.last_ntp_sync
         if delta.days > 0:
             return f"{delta.days}d ago"
         elif delta.seconds > 3600:
@@ -1219,159 +1621,261 @@ class FramebufferClock:
         else:
             return "Just now"
     
-    def update_pixel_shift(self):
-        """Update pixel shift offset."""
+    @staticmethod
+    def _random_offset(limit: int) -> int:
+        """Random integer in [-limit, limit] (no need for the random module's state here)."""
+        if limit <= 0:
+            return 0
+        return int.from_bytes(os.urandom(4), 'little') % (2 * limit + 1) - limit
+
+    def update_pixel_shift(self, now_dt: Optional[datetime] = None, ticks: Optional[float] = None):
+        """Update pixel shift offset.
+        ticks: the loop's time.monotonic() reading, shared with the other interval checks.
+        """
         if not self.pixel_shift_enabled:
             return
-        current_hour = datetime.now().hour
-        if self.is_in_time_window(current_hour, self.pixel_shift_disable_start, self.pixel_shift_disable_end):
+        now_dt = now_dt or datetime.now()
+        if self._hour_windows(now_dt.hour)[2]:
             return
         
-        now = time.time()
+        now = ticks if ticks is not None else time.monotonic()
         # Apply pixel shift only at minute boundary to avoid visible tearing
-        if now - self.last_pixel_shift > self.pixel_shift_interval and datetime.now().second == 0:
-            # Lazy import random only when needed
-            import random
-            self.pixel_shift_x = random.randint(-self.pixel_shift_max, self.pixel_shift_max)
-            self.pixel_shift_y = random.randint(-self.pixel_shift_max, self.pixel_shift_max)
+        if now - self.last_pixel_shift > self.pixel_shift_interval and now_dt.second == 0:
+            self.pixel_shift_x, self.pixel_shift_y = self._shift_cycle[self._shift_idx]
+            self._shift_idx = (self._shift_idx + 1) % len(self._shift_cycle)
+            if self._shift_idx == 0:
+                # New order every cycle so the same path isn't replayed for the life of the process
+                self._shift_rng.shuffle(self._shift_cycle)
             self.last_pixel_shift = now
             logging.debug(f"Pixel shift applied: x={self.pixel_shift_x:+d}, y={self.pixel_shift_y:+d}")
     
-    def update_burn_in_protection(self):
+    def update_burn_in_protection(self, now_dt: Optional[datetime] = None, ticks: Optional[float] = None):
         """Vary font size and characteristics to prevent burn-in."""
         if not self.pixel_shift_enabled:  # Reuse same enable flag
             return
         
-        now = time.time()
+        now = ticks if ticks is not None else time.monotonic()
         # Change font characteristics every 5 minutes
         if not hasattr(self, '_last_font_variation'):
-            self._last_font_variation = 0
+            self._last_font_variation = float('-inf')
             self._font_size_offset = 0
         
-        if now - self._last_font_variation > 300 and datetime.now().second == 0:  # 5 min
-            import random
+        if now - self._last_font_variation > 300 and (now_dt or datetime.now()).second == 0:  # 5 min
             # Vary time font size by ±8% (e.g., 280 ± 22px)
             base_size = self.base_time_font_size
             variation = int(base_size * 0.08)
-            self._font_size_offset = random.randint(-variation, variation)
+            self._font_size_offset = self._random_offset(variation)
             new_size = max(10, int((base_size + self._font_size_offset) * self.display_scale))
             
             try:
                 if getattr(self, 'font_file', None):
-                    self.time_font = ImageFont.truetype(self.font_file, new_size)
+                    self.time_font = self._get_time_font(new_size)
                     self.time_font_size = new_size
-                    # Update cache
-                    self._font_cache[new_size] = self.time_font
                     logging.debug(f"Font size varied: {new_size}px (offset: {self._font_size_offset:+d}px)")
             except Exception as e:
                 logging.warning(f"Font variation failed: {e}")
             
             self._last_font_variation = now
     
-    def update_weather(self):
-        """Update weather information periodically."""
+    def update_weather(self) -> bool:
+        """Fetch weather once and publish the display text.
+        Returns True only if a fresh fetch succeeded (not a cached or stale fallback reading).
+        """
         if not self.weather_service:
-            return
-        now = time.time()
-        if now - self.last_weather_update > 600:  # Update every 10 minutes
+            return False
+        try:
+            fetched_before = self.weather_service.last_fetch_time
+            weather = self.weather_service.get_weather()
+            if weather:
+                # WeatherService reports the description under 'condition'
+                desc = weather.get('condition') or weather.get('description', '')
+                self.weather_text = f"{weather.get('temp', '')}° {desc}"
+            self.last_weather_update = time.monotonic()
+            return self.weather_service.last_fetch_time != fetched_before
+        except Exception as e:
+            logging.error(f"Weather update failed: {e}")
+            return False
+    
+    def _weather_worker(self):
+        """Background worker: fetch weather every 10 minutes off the render thread.
+        The HTTP round-trip can take seconds; the render loop only reads weather_text.
+        """
+        while self.running:
+            previous_text = self.weather_text
+            fetched = self.update_weather()
+            # Update every 10 minutes; back off to 15 only when a successful fetch returned the
+            # same reading - a failed fetch also leaves the text alone but must not back off
+            interval = 900 if fetched and previous_text and self.weather_text == previous_text else 600
+            if self._worker_stop.wait(interval):
+                break
+    
+    def _status_worker(self):
+        """Background worker: refresh network/NTP status off the render thread.
+        The checks fork subprocesses and open sockets with multi-second timeouts,
+        which would otherwise stall the 1 Hz tick. Results are published via plain
+        attribute assignment, which the render loop reads as-is.
+        """
+        while self.running:
             try:
-                weather = self.weather_service.get_weather()
-                if weather:
-                    self.weather_text = f"{weather.get('temp', '')}° {weather.get('description', '')}"
-                self.last_weather_update = now
+                self.check_network_status()
+                self.check_last_ntp_sync()
+                self.last_status_check = time.monotonic()
             except Exception as e:
-                logging.error(f"Weather update failed: {e}")
+                logging.warning(f"Status check failed: {e}")
+            # Update every 2 minutes (reduce subprocess overhead); retry sooner while offline
+            # so the status bar recovers quickly. Wakes early on shutdown.
+            interval = 120 if self.network_status == "Connected" else 20
+            if self._worker_stop.wait(interval):
+                break
     
-    def update_status(self):
-        """Update status information periodically."""
-        now = time.time()
-        if now - self.last_status_check > 120:  # Update every 2 minutes (reduce subprocess overhead)
-            self.check_network_status()
-            self.check_last_ntp_sync()
-            self.last_status_check = now
+    def start_background_workers(self):
+        """Start the status and weather worker threads (idempotent)."""
+        if getattr(self, '_worker_stop', None):
+            return
+        self._worker_stop = threading.Event()
+        self._status_thread = threading.Thread(target=self._status_worker, name='status-worker', daemon=True)
+        self._status_thread.start()
+        if self.weather_service:
+            self._weather_thread = threading.Thread(target=self._weather_worker, name='weather-worker', daemon=True)
+            self._weather_thread.start()
     
-    def render(self):
-        """Render the clock display using partial updates into shadow buffer."""
-        t_start = time.time()
+    def _clear_shadow(self):
+        """Blank the whole shadow buffer and forget what was drawn where."""
+        self.fb_shadow.fill(0)
+        self._blit_sources.clear()
+    
+    def render(self, now: Optional[datetime] = None):
+        """Render the clock display using partial updates into shadow buffer.
+        now: the loop's wall-clock reading for this frame (read once, shared by all checks).
+        """
+        t_start = time.monotonic()
+        now = now or datetime.now()
+        # Per-element timings are only collected when debug logging is on
+        debug_timing = logging.getLogger().isEnabledFor(logging.DEBUG)
         
         # One-time full clear on first render to remove balena background
         if not hasattr(self, '_initial_clear_done'):
             logging.info("Initial framebuffer clear to remove boot background")
-            self.fb_shadow.fill(0)
+            self._clear_shadow()
             self.write_to_framebuffer(None)
+            # The sysfs blank flag outlives the process - a previous instance may have been
+            # restarted mid-screensaver and left the panel powered down
+            self._set_display_blank(False)
             self._initial_clear_done = True
         
         try:
             # If screensaver, write blank and return
-            if not self.should_show_display():
-                logging.debug("Screensaver active - blanking display")
-                self.fb_shadow.fill(0)
-                self.write_to_framebuffer(None)
+            if not self.should_show_display(now):
+                # Blank once on entry; the screen stays black, so later frames do nothing
+                if not self._screensaver_blanked:
+                    logging.info("Screensaver active - blanking display")
+                    self._clear_shadow()
+                    self._dirty_rects.clear()
+                    self.write_to_framebuffer(None)
+                    self._set_display_blank(True)
+                    self._screensaver_blanked = True
                 return
+            if self._screensaver_blanked:
+                logging.info("Screensaver ended - redrawing display")
+                self._set_display_blank(False)
+                self._screensaver_blanked = False
+                self._last_frame_key = None
         except Exception as e:
             logging.error(f"Error in render setup: {e}", exc_info=True)
             return
         
         # Update brightness
-        self.update_brightness()
+        self.update_brightness(now)
         
-        # Get current time
-        now = datetime.now()
+        # Format current time
         time_str = self.format_time(now)
         date_str = self.format_date(now)
         
+        sync_time = self.get_time_since_sync(now)
+        
+        # Skip the whole frame when nothing visible has changed since the last one
+        # (the pointer cursor is part of the key; with the overlay open only its own state matters,
+        # since it hides everything else)
+        pointer = (self.pointer_x, self.pointer_y) if getattr(self, 'input_devices', None) else None
+        overlay_key = None
+        if self.show_settings_overlay:
+            overlay_key = self._overlay_state_key(now)
+            frame_key = ('overlay', overlay_key, pointer)
+        else:
+            frame_key = (time_str, date_str, self.weather_text, self.current_brightness,
+                         self.status_color, self.pixel_shift_x, self.pixel_shift_y,
+                         self.network_status, sync_time, pointer)
+        if frame_key == getattr(self, '_last_frame_key', None):
+            logging.debug("Frame unchanged - skipping render")
+            return
+        self._last_frame_key = frame_key
+        self._frame_drawn.clear()
+        
+        if self.show_settings_overlay:
+            # Full-screen overlay: draw only it and the cursor; the clock is redrawn when it closes
+            self._render_settings_overlay(overlay_key)
+            self._render_cursor()
+            if self._dirty_rects:
+                self.write_to_framebuffer(None)
+            return
+        
         # Detect pixel shift change and clear old positions to prevent artifacts
         shift_changed = (self.pixel_shift_x != self._prev_pixel_shift_x or 
                         self.pixel_shift_y != self._prev_pixel_shift_y)
-        if shift_changed:
+        if shift_changed or self._needs_full_clear:
+            self._needs_full_clear = False
             # Full framebuffer clear to eliminate all artifacts
             logging.info(f"Pixel shift: ({self._prev_pixel_shift_x},{self._prev_pixel_shift_y}) → ({self.pixel_shift_x},{self.pixel_shift_y}), clearing screen")
-            self.fb_shadow.fill(0)
-            # Write the clear immediately before drawing new content
-            self.write_to_framebuffer(None)
+            self._clear_shadow()
+            # Don't push the black frame on its own (visible flash, and a second full-screen copy):
+            # mark the whole screen dirty so the end-of-frame write sends clear + new content at once
+            self._dirty_rects[:] = [(0, 0, self.fb_width, self.fb_height)]
             # Reset all tracked rects
             self._last_time_rect = None
             self._last_date_rect = None
             self._last_status_rect = None
             if hasattr(self, '_last_weather_rect'):
                 self._last_weather_rect = None
+            self._last_overlay_rect = None
             # Update tracking
             self._prev_pixel_shift_x = self.pixel_shift_x
             self._prev_pixel_shift_y = self.pixel_shift_y
         
-        # Apply brightness
-        display_color = self.apply_brightness(self.color)
-        status_color = self.apply_brightness(self.status_color)
+        # Apply brightness (recomputed only when brightness or a base color changes)
+        display_color, status_color = self._effective_colors()
         
-        t_prep = time.time()
+        t_prep = time.monotonic()
+        # Geometry read once into locals - used throughout the layout below
+        fb_width, fb_height, scale = self.fb_width, self.fb_height, self.display_scale
         
         # Calculate center position with pixel shift (full resolution)
-        center_x = self.fb_width // 2 + self.pixel_shift_x
+        center_x = fb_width // 2 + self.pixel_shift_x
         # Time should stay strictly centered horizontally unless explicitly enabled
-        center_x_time = self.fb_width // 2 + (self.pixel_shift_x if self.pixel_shift_time_enabled else 0)
-        center_y = self.fb_height // 2 + self.pixel_shift_y
+        center_x_time = fb_width // 2 + (self.pixel_shift_x if self.pixel_shift_time_enabled else 0)
+        center_y = fb_height // 2 + self.pixel_shift_y
         
         # Dynamic margins and offsets (use cached scale)
-        margin = int(30 * self.display_scale)
-        time_offset_y = int(60 * self.display_scale)
-        date_offset_y = int(100 * self.display_scale)
+        margin = int(30 * scale)
+        time_offset_y = int(60 * scale)
+        date_offset_y = int(100 * scale)
         
         # Render time using pre-rendered sprite cache (7-15x faster)
-        t_cache_start = time.time()
-        time_result = self._composite_time_from_cache(time_str, display_color)
-        cache_time_ms = (time.time() - t_cache_start) * 1000
+        t_cache_start = time.monotonic() if debug_timing else 0.0
+        time_result = self._cached_composite('time', time_str, display_color)
+        cache_time_ms = (time.monotonic() - t_cache_start) * 1000 if debug_timing else 0.0
         
         if time_result:
             # Result is (rgb565_array, width, height)
             time_rgb565, time_w, time_h = time_result
-            time_x = max(margin, min(self.fb_width - margin - time_w, center_x_time - (time_w // 2)))
-            time_y = max(margin, min(self.fb_height - margin - time_h, center_y - time_offset_y - (time_h // 2)))
-            t_blit_start = time.time()
+            time_x = max(margin, min(fb_width - margin - time_w, center_x_time - (time_w // 2)))
+            time_y = max(margin, min(fb_height - margin - time_h, center_y - time_offset_y - (time_h // 2)))
+            t_blit_start = time.monotonic() if debug_timing else 0.0
             self.blit_rgb565_direct(time_rgb565, time_x, time_y, clear_last_rect_attr='_last_time_rect', skip_write=True, clear_full_region=True)
-            blit_time_ms = (time.time() - t_blit_start) * 1000
-            logging.info(f"Time: cache={cache_time_ms:.1f}ms, blit={blit_time_ms:.1f}ms")
+            if debug_timing:
+                blit_time_ms = (time.monotonic() - t_blit_start) * 1000
+                logging.debug(f"Time: cache={cache_time_ms:.1f}ms, blit={blit_time_ms:.1f}ms")
             if not hasattr(self, '_cache_hit_logged'):
-                logging.info(f"Sprite cache HIT: rendered time in {cache_time_ms:.1f}ms (vs 750ms direct)")
+                logging.info("Sprite cache HIT: time composited from pre-rendered sprites")
                 self._cache_hit_logged = True
         else:
             # Fallback to direct rendering if cache fails (shouldn't happen)
@@ -1384,134 +1888,169 @@ class FramebufferClock:
             t_pad = max(40, int(self.time_font_size * 0.15))
             time_img = Image.new('RGB', (text_w + 2*t_pad, text_h + 2*t_pad), (0,0,0))
             ImageDraw.Draw(time_img).text((t_pad - time_bbox[0], t_pad - time_bbox[1]), time_str, font=self.time_font, fill=display_color)
-            time_x = max(margin, min(self.fb_width - margin - time_img.width, center_x_time - (time_img.width // 2)))
-            time_y = max(margin, min(self.fb_height - margin - time_img.height, center_y - time_offset_y - (time_img.height // 2)))
+            time_x = max(margin, min(fb_width - margin - time_img.width, center_x_time - (time_img.width // 2)))
+            time_y = max(margin, min(fb_height - margin - time_img.height, center_y - time_offset_y - (time_img.height // 2)))
             self.blit_rgb_image(time_img, time_x, time_y, clear_last_rect_attr='_last_time_rect', skip_write=True, clear_full_region=True)
         
         # Render date with generous padding - try sprite cache first
-        t_date_start = time.time()
-        date_result = self._composite_date_from_cache(date_str, display_color)
-        date_cache_ms = (time.time() - t_date_start) * 1000
+        t_date_start = time.monotonic() if debug_timing else 0.0
+        date_result = self._cached_composite('date', date_str, display_color)
+        date_cache_ms = (time.monotonic() - t_date_start) * 1000 if debug_timing else 0.0
         
         if date_result:
             # Result is (rgb565_array, width, height)
             date_rgb565, date_w, date_h = date_result
-            date_x = max(margin, min(self.fb_width - margin - date_w, center_x - (date_w // 2)))
-            date_y = max(margin, min(self.fb_height - margin - date_h, center_y + date_offset_y))
-            t_blit_start = time.time()
+            date_x = max(margin, min(fb_width - margin - date_w, center_x - (date_w // 2)))
+            date_y = max(margin, min(fb_height - margin - date_h, center_y + date_offset_y))
+            t_blit_start = time.monotonic() if debug_timing else 0.0
             self.blit_rgb565_direct(date_rgb565, date_x, date_y, clear_last_rect_attr='_last_date_rect', skip_write=True, clear_full_region=True)
-            blit_date_ms = (time.time() - t_blit_start) * 1000
-            logging.info(f"Date: cache={date_cache_ms:.1f}ms, blit={blit_date_ms:.1f}ms")
+            if debug_timing:
+                blit_date_ms = (time.monotonic() - t_blit_start) * 1000
+                logging.debug(f"Date: cache={date_cache_ms:.1f}ms, blit={blit_date_ms:.1f}ms")
             if not hasattr(self, '_date_cache_hit_logged'):
-                logging.info(f"Date sprite cache HIT: rendered '{date_str}' in {date_cache_ms:.1f}ms")
+                logging.info(f"Date sprite cache HIT: rendered '{date_str}' from pre-rendered sprites")
                 self._date_cache_hit_logged = True
         else:
             # Fallback to direct rendering (slow path)
             if not hasattr(self, '_date_cache_miss_logged'):
                 logging.warning(f"Date sprite cache MISS for '{date_str}', using slow direct rendering")
                 self._date_cache_miss_logged = True
-            if not self._temp_draw:
-                self._temp_draw = ImageDraw.Draw(Image.new('RGB', (1,1)))
-            date_bbox = self._temp_draw.textbbox((0,0), date_str, font=self.date_font)
-            date_w = date_bbox[2] - date_bbox[0]
-            date_h = date_bbox[3] - date_bbox[1]
-            d_pad_left = max(40, int(self.date_font_size * 0.4))
-            d_pad_right = max(40, int(self.date_font_size * 0.4))
-            d_pad_top = max(20, int(self.date_font_size * 0.2))
-            d_pad_bottom = max(20, int(self.date_font_size * 0.2))
-            date_canvas_w = date_w + d_pad_left + d_pad_right
-            date_canvas_h = date_h + d_pad_top + d_pad_bottom
-            date_x = max(margin, min(self.fb_width - margin - date_canvas_w, center_x - date_canvas_w // 2))
-            date_y = max(margin, min(self.fb_height - margin - date_canvas_h, center_y + date_offset_y))
-            date_img = Image.new('RGB', (date_canvas_w, date_canvas_h), (0,0,0))
-            ImageDraw.Draw(date_img).text((d_pad_left - date_bbox[0], d_pad_top - date_bbox[1]), date_str, font=self.date_font, fill=display_color)
+            # The date changes once a day - rasterize it once, not on every tick
+            date_key = (date_str, display_color)
+            if getattr(self, '_date_fallback_key', None) != date_key:
+                if not self._temp_draw:
+                    self._temp_draw = ImageDraw.Draw(Image.new('RGB', (1,1)))
+                date_bbox = self._temp_draw.textbbox((0,0), date_str, font=self.date_font)
+                date_w = date_bbox[2] - date_bbox[0]
+                date_h = date_bbox[3] - date_bbox[1]
+                d_pad_left = max(40, int(self.date_font_size * 0.4))
+                d_pad_right = max(40, int(self.date_font_size * 0.4))
+                d_pad_top = max(20, int(self.date_font_size * 0.2))
+                d_pad_bottom = max(20, int(self.date_font_size * 0.2))
+                date_img = Image.new('RGB', (date_w + d_pad_left + d_pad_right, date_h + d_pad_top + d_pad_bottom), (0,0,0))
+                ImageDraw.Draw(date_img).text((d_pad_left - date_bbox[0], d_pad_top - date_bbox[1]), date_str, font=self.date_font, fill=display_color)
+                self._date_fallback_img = date_img
+                self._date_fallback_key = date_key
+            date_img = self._date_fallback_img
+            date_x = max(margin, min(fb_width - margin - date_img.width, center_x - date_img.width // 2))
+            date_y = max(margin, min(fb_height - margin - date_img.height, center_y + date_offset_y))
             self.blit_rgb_image(date_img, date_x, date_y, clear_last_rect_attr='_last_date_rect', skip_write=True, clear_full_region=True)
         
         # Draw weather if available (measure, pad, and blit like time/date)
-        if self.weather_text:
-            if not self._temp_draw:
-                self._temp_draw = ImageDraw.Draw(Image.new('RGB', (1,1)))
-            wb = self._temp_draw.textbbox((0, 0), self.weather_text, font=self.weather_font)
-            ww = wb[2] - wb[0]
-            wh = wb[3] - wb[1]
-            w_pad_left = max(12, int(self.weather_font_size * 0.2))
-            w_pad_right = max(12, int(self.weather_font_size * 0.2))
-            w_pad_top = max(6, int(self.weather_font_size * 0.12))
-            w_pad_bottom = max(6, int(self.weather_font_size * 0.12))
-            weather_img = Image.new('RGB', (ww + w_pad_left + w_pad_right, wh + w_pad_top + w_pad_bottom), (0,0,0))
-            ImageDraw.Draw(weather_img).text((w_pad_left - wb[0], w_pad_top - wb[1]), self.weather_text, font=self.weather_font, fill=display_color)
+        weather_text = self.weather_text
+        if weather_text:
+            # Weather text changes every 10 minutes at most - reuse the rendered image until then
+            weather_key = (weather_text, display_color)
+            if getattr(self, '_weather_cache_key', None) != weather_key:
+                if not self._temp_draw:
+                    self._temp_draw = ImageDraw.Draw(Image.new('RGB', (1,1)))
+                wb = self._temp_draw.textbbox((0, 0), weather_text, font=self.weather_font)
+                ww = wb[2] - wb[0]
+                wh = wb[3] - wb[1]
+                w_pad_left = max(12, int(self.weather_font_size * 0.2))
+                w_pad_right = max(12, int(self.weather_font_size * 0.2))
+                w_pad_top = max(6, int(self.weather_font_size * 0.12))
+                w_pad_bottom = max(6, int(self.weather_font_size * 0.12))
+                weather_img = Image.new('RGB', (ww + w_pad_left + w_pad_right, wh + w_pad_top + w_pad_bottom), (0,0,0))
+                ImageDraw.Draw(weather_img).text((w_pad_left - wb[0], w_pad_top - wb[1]), weather_text, font=self.weather_font, fill=display_color)
+                self._weather_cached_img = weather_img
+                self._weather_cached_rgb565 = self._image_to_rgb565(weather_img) if self.fb_bpp == 16 else None
+                self._weather_cache_key = weather_key
+            weather_img = self._weather_cached_img
             weather_x = center_x - (weather_img.width // 2)
-            weather_y = center_y + int(120 * self.display_scale)
-            self.blit_rgb_image(weather_img, weather_x, weather_y, clear_last_rect_attr='_last_weather_rect', skip_write=True)
+            weather_y = center_y + int(120 * scale)
+            if self._weather_cached_rgb565 is not None:
+                self.blit_rgb565_direct(self._weather_cached_rgb565, weather_x, weather_y, clear_last_rect_attr='_last_weather_rect', skip_write=True)
+            else:
+                self.blit_rgb_image(weather_img, weather_x, weather_y, clear_last_rect_attr='_last_weather_rect', skip_write=True)
         
         # Draw status bar
         if self.show_status_bar:
-            status_items = []  # list of (name, label)
-            # Network with icon
-            if self.network_status:
-                if "Connected" in self.network_status:
-                    status_items.append(("network", self.network_status))
+            # Only rebuild the item list when one of its inputs changed
+            items_key = (self._network_item, self._timezone_item, sync_time)
+            if items_key != getattr(self, '_status_items_key', None):
+                status_items = []  # list of (name, label)
+                # Network with icon
+                network_item = self._network_item
+                if network_item:
+                    status_items.append(network_item)
+                # Timezone
+                if self._timezone_item:
+                    status_items.append(self._timezone_item)
+                # Sync status
+                if sync_time == "Just now" or "m ago" in sync_time:
+                    status_items.append(("sync_ok", f"Sync: {sync_time}"))
                 else:
-                    status_items.append(("error", self.network_status))
-            # Timezone
-            if self.timezone_name:
-                status_items.append(("timezone", f"TZ:{self.timezone_name}"))
-            # Sync status
-            sync_time = self.get_time_since_sync()
-            if sync_time == "Just now" or "m ago" in sync_time:
-                status_items.append(("sync_ok", f"Sync: {sync_time}"))
-            else:
-                status_items.append(("sync_old", f"Sync: {sync_time}"))
-            
-            # Add version info
-            if self.build_info:
-                ver = self.build_info.get("git_version") or ""
-                sha = self.build_info.get("git_sha") or ""
-                short_sha = sha[:7] if isinstance(sha, str) and sha else ""
-                parts = []
-                if ver:
-                    parts.append(ver)
-                if short_sha:
-                    parts.append(short_sha)
-                if parts:
-                    status_items.append(("version", " ".join(parts)))
-            # Always append settings item for overlay access
-            status_items.append(("settings", "Settings"))
-            
-            status_text = " | ".join([label for _, label in status_items])
+                    status_items.append(("sync_old", f"Sync: {sync_time}"))
+                
+                # Add version info
+                if self._version_item:
+                    status_items.append(self._version_item)
+                # Always append settings item for overlay access
+                status_items.append(("settings", "Settings"))
+                self._status_items = status_items
+                self._status_items_key = items_key
+            status_items = self._status_items
             
             # Status bar position is now fixed to avoid artifacts
             # Rotation disabled - pixel shift still provides burn-in protection
             # Render status bar using consolidated method
-            t_status_start = time.time()
+            t_status_start = time.monotonic() if debug_timing else 0.0
             self._render_status_bar(status_items, status_color, margin)
-            status_ms = (time.time() - t_status_start) * 1000
-            logging.info(f"Status: total={status_ms:.1f}ms")
+            if debug_timing:
+                status_ms = (time.monotonic() - t_status_start) * 1000
+                logging.debug(f"Status: total={status_ms:.1f}ms")
         
-        t_draw = time.time()
-        # Render settings overlay if active
-        if self.show_settings_overlay:
-            self._render_settings_overlay()
+        t_draw = time.monotonic()
         # Optional pointer cursor (visible when input present)
-        if getattr(self, 'input_devices', None):
-            cur_size = 8
-            cur_img = Image.new('RGB', (cur_size, cur_size), (0,0,0))
-            cd = ImageDraw.Draw(cur_img)
-            cd.ellipse((1,1,cur_size-2,cur_size-2), outline=(255,255,255))
-            px = max(0, min(self.fb_width - cur_size, self.pointer_x))
-            py = max(0, min(self.fb_height - cur_size, self.pointer_y))
-            self.blit_rgb_image(cur_img, px, py, clear_last_rect_attr='_last_cursor_rect', skip_write=True)
-        # Write shadow buffer to framebuffer ONCE at the end
-        self.write_to_framebuffer(None)
-        t_write = time.time()
-        
-        # Log timing breakdown
-        total = (t_write - t_start) * 1000
-        prep = (t_prep - t_start) * 1000
-        draw_time = (t_draw - t_prep) * 1000
-        write = (t_write - t_draw) * 1000
-        logging.info(f"Render timing: total={total:.1f}ms (prep={prep:.1f}ms, draw={draw_time:.1f}ms, write={write:.1f}ms) @ {self.fb_width}x{self.fb_height}")
+        self._render_cursor()
+        # Write shadow buffer to framebuffer ONCE at the end - only if something was drawn
+        # (an empty dirty list would otherwise fall back to a full-screen write)
+        if self._dirty_rects:
+            self.write_to_framebuffer(None)
+        t_write = time.monotonic()
+        
+        # Log timing breakdown (every frame at DEBUG, once a minute at INFO)
+        if debug_timing or t_write - self._last_timing_log >= 60:
+            self._last_timing_log = t_write
+            total = (t_write - t_start) * 1000
+            prep = (t_prep - t_start) * 1000
+            draw_time = (t_draw - t_prep) * 1000
+            write = (t_write - t_draw) * 1000
+            logging.info(f"Render timing: total={total:.1f}ms (prep={prep:.1f}ms, draw={draw_time:.1f}ms, write={write:.1f}ms) @ {self.fb_width}x{self.fb_height}")
     
+    @staticmethod
+    def _coalesce_rects(rects):
+        """Merge overlapping/touching (x, y, w, h) rects into their bounding boxes."""
+        merged = [r for r in rects if r[2] > 0 and r[3] > 0]
+        changed = True
+        while changed and len(merged) > 1:
+            changed = False
+            out = []
+            for rx, ry, rw, rh in merged:
+                for i, (ox, oy, ow, oh) in enumerate(out):
+                    if rx <= ox + ow and ox <= rx + rw and ry <= oy + oh and oy <= ry + rh:
+                        nx, ny = min(rx, ox), min(ry, oy)
+                        out[i] = (nx, ny, max(rx + rw, ox + ow) - nx, max(ry + rh, oy + oh) - ny)
+                        changed = True
+                        break
+                else:
+                    out.append((rx, ry, rw, rh))
+            merged = out
+        return merged
+
+    def _wait_for_vsync(self):
+        """Block until the next vertical blank when FB_WAIT_VSYNC is on.
+        The first failure (driver without the ioctl) turns it off for good.
+        """
+        if not self.fb_wait_vsync or not getattr(self, '_fb_file', None):
+            return
+        try:
+            fcntl.ioctl(self._fb_file.fileno(), self.FBIO_WAITFORVSYNC, struct.pack('I', 0))
+        except OSError as e:
+            logging.warning(f"FBIO_WAITFORVSYNC not supported by {self.fb_device}, disabling: {e}")
+            self.fb_wait_vsync = False
+
     def write_to_framebuffer(self, image):
         """Write image directly to framebuffer device.
         If using 16bpp shadow buffer, write only dirty rectangles.
@@ -1520,8 +2059,12 @@ class FramebufferClock:
             # For partial-update path, write only dirty rects if present
             if self.fb_bpp == 16 and isinstance(self.fb_shadow, np.ndarray):
                 if getattr(self, '_dirty_rects', None):
-                    if self.fb_mmap:
-                        # Use memory map for fast row copies
+                    # Merge overlapping rects (e.g. a clear region and the blit inside it)
+                    # so each pixel is copied once and the copy loop runs over fewer rects
+                    self._dirty_rects[:] = self._coalesce_rects(self._dirty_rects)
+                    if self._fb_view is not None:
+                        self._wait_for_vsync()
+                        # Copy each dirty rect in one strided numpy assignment (no per-row Python loop)
                         for (rx, ry, rw, rh) in self._dirty_rects:
                             if rw <= 0 or rh <= 0:
                                 continue
@@ -1531,10 +2074,7 @@ class FramebufferClock:
                             rh = max(0, min(self.fb_height - ry, rh))
                             if rw == 0 or rh == 0:
                                 continue
-                            for row in range(rh):
-                                offset = ((ry + row) * self._fb_stride_bytes) + (rx * 2)
-                                slice_row = self.fb_shadow[ry + row, rx:rx+rw]
-                                self.fb_mmap[offset:offset + (rw * 2)] = slice_row.astype('<u2').tobytes()
+                            self._fb_view[ry:ry+rh, rx:rx+rw] = self.fb_shadow[ry:ry+rh, rx:rx+rw]
                         self._dirty_rects.clear()
                     else:
                         # Fallback to file writes with seek
@@ -1557,12 +2097,10 @@ class FramebufferClock:
                             self._dirty_rects.clear()
                 else:
                     # No dirty rects tracked; fallback to full shadow write
-                    if self.fb_mmap:
-                        # Copy entire shadow into mmap in chunks to avoid huge temporary buffers
-                        for row in range(self.fb_height):
-                            offset = (row * self._fb_stride_bytes)
-                            slice_row = self.fb_shadow[row, :]
-                            self.fb_mmap[offset:offset + self._fb_stride_bytes] = slice_row.astype('<u2').tobytes()
+                    if self._fb_view is not None:
+                        self._wait_for_vsync()
+                        # Copy entire shadow into the mapping directly (no temporary buffers)
+                        self._fb_view[:, :] = self.fb_shadow
                     else:
                         with open(self.fb_device, 'wb') as fb:
                             fb.write(self.fb_shadow.astype('<u2').tobytes())
@@ -1587,6 +2125,28 @@ class FramebufferClock:
             logging.error(f"Failed to write to framebuffer: {e}")
 
 
+    def _forget_overlapping_blits(self, attr, x1, y1, x2, y2, later_only=False):
+        """attr overwrote (x1,y1)-(x2,y2): elements still to be drawn this frame (above attr in
+        z-order) lose their skip entry so they get re-blitted on top.
+        later_only=False is for clears, which also wipe elements already drawn this frame
+        (below attr): the wiped part of those is put back from their source right away.
+        """
+        # Restore in draw order, so elements drawn earlier this frame stack up as before
+        for other in list(self._frame_drawn) + [o for o in self._blit_sources if o not in self._frame_drawn]:
+            if other == attr or other not in self._blit_sources:
+                continue
+            rect = getattr(self, other, None)
+            if not (rect and rect[0] < x2 and x1 < rect[0] + rect[2] and rect[1] < y2 and y1 < rect[1] + rect[3]):
+                continue
+            if other not in self._frame_drawn:
+                del self._blit_sources[other]
+            elif not later_only:
+                arr, ox, oy = self._blit_sources[other]
+                ix1, iy1 = max(x1, rect[0]), max(y1, rect[1])
+                ix2, iy2 = min(x2, rect[0] + rect[2]), min(y2, rect[1] + rect[3])
+                # The cleared area is already dirty, so no new rect is needed
+                self.fb_shadow[iy1:iy2, ix1:ix2] = arr[iy1 - oy:iy2 - oy, ix1 - ox:ix2 - ox]
+
     def blit_rgb565_direct(self, rgb565_array: np.ndarray, x: int, y: int, clear_last_rect_attr: str, skip_write: bool = False, clear_full_region: bool = False):
         """Blit pre-converted RGB565 array directly to framebuffer (ultra-fast, no conversion).
         rgb565_array: 2D numpy array of uint16 RGB565 pixels
@@ -1599,6 +2159,13 @@ class FramebufferClock:
         if w <= 0 or h <= 0:
             return
         
+        # Same cached pixels at the same spot are already on screen - nothing is dirty
+        last_src = self._blit_sources.get(clear_last_rect_attr)
+        if (last_src is not None and last_src[0] is rgb565_array and last_src[1] == x and last_src[2] == y
+                and getattr(self, clear_last_rect_attr, None) is not None):
+            self._frame_drawn[clear_last_rect_attr] = None
+            return
+        
         # Get current rect
         x2 = min(self.fb_width, x + w)
         y2 = min(self.fb_height, y + h)
@@ -1635,9 +2202,33 @@ class FramebufferClock:
                 clear_y2 = min(self.fb_height, ly + lh + clear_pad)
             
             self.fb_shadow[clear_y1:clear_y2, clear_x1:clear_x2].fill(0)
+            # The cleared area must reach the framebuffer too, not just the new rect
+            self._dirty_rects.append((clear_x1, clear_y1, clear_x2 - clear_x1, clear_y2 - clear_y1))
+            self._forget_overlapping_blits(clear_last_rect_attr, clear_x1, clear_y1, clear_x2, clear_y2)
+        elif last_rect is not None:
+            # Same spot and size as last time (e.g. the time ticking over): copy and mark dirty
+            # only the bounding box of what differs. Diff against the shadow itself, not the
+            # previous source - an overlapping element may have drawn into this rect since
+            src = rgb565_array[:h_clamp, :w_clamp]
+            changed = src != self.fb_shadow[y:y2, x:x2]
+            rows = np.flatnonzero(changed.any(axis=1))
+            if rows.size:
+                cols = np.flatnonzero(changed.any(axis=0))
+                ry1, ry2 = int(rows[0]), int(rows[-1]) + 1
+                rx1, rx2 = int(cols[0]), int(cols[-1]) + 1
+                self.fb_shadow[y + ry1:y + ry2, x + rx1:x + rx2] = src[ry1:ry2, rx1:rx2]
+                if hasattr(self, '_dirty_rects'):
+                    self._dirty_rects.append((x + rx1, y + ry1, rx2 - rx1, ry2 - ry1))
+                self._forget_overlapping_blits(clear_last_rect_attr, x + rx1, y + ry1, x + rx2, y + ry2, later_only=True)
+            self._blit_sources[clear_last_rect_attr] = (rgb565_array, x, y)
+            self._frame_drawn[clear_last_rect_attr] = None
+            return
         
         # Blit RGB565 directly (NO conversion needed!)
         self.fb_shadow[y:y2, x:x2] = rgb565_array[:h_clamp, :w_clamp]
+        self._blit_sources[clear_last_rect_attr] = (rgb565_array, x, y)
+        self._forget_overlapping_blits(clear_last_rect_attr, x, y, x2, y2, later_only=True)
+        self._frame_drawn[clear_last_rect_attr] = None
         
         # Store rect
         rect = (x, y, w_clamp, h_clamp)
@@ -1704,6 +2295,11 @@ class FramebufferClock:
                 clear_y2 = min(self.fb_height, ly + lh + clear_pad)
             
             self.fb_shadow[clear_y1:clear_y2, clear_x1:clear_x2].fill(0)
+            # The cleared area must reach the framebuffer too, not just the new rect
+            self._dirty_rects.append((clear_x1, clear_y1, clear_x2 - clear_x1, clear_y2 - clear_y1))
+            self._forget_overlapping_blits(clear_last_rect_attr, clear_x1, clear_y1, clear_x2, clear_y2)
+        
+        self._blit_sources.pop(clear_last_rect_attr, None)
         
         # Convert to RGB565
         arr = np.frombuffer(img.tobytes(), dtype=np.uint8).reshape((img.height, img.width, 3))[:h_clamp, :w_clamp]
@@ -1713,6 +2309,8 @@ class FramebufferClock:
         rgb565 = ((r << 11) | (g << 5) | b)
         # Blit into shadow
         self.fb_shadow[y:y2, x:x2] = rgb565
+        self._forget_overlapping_blits(clear_last_rect_attr, x, y, x2, y2, later_only=True)
+        self._frame_drawn[clear_last_rect_attr] = None
         # Store rect
         rect = (x, y, w_clamp, h_clamp)
         setattr(self, clear_last_rect_attr, rect)
@@ -1831,19 +2429,77 @@ class FramebufferClock:
             logging.info("Restart requested from settings menu")
             self.running = False
     
+    def _sleep_until_boundary(self, period: float):
+        """Sleep until just past the next wall-clock multiple of period seconds.
+        Waking a few ms after the boundary guarantees the new second/minute is
+        visible to datetime.now(), so the loop never spins on an early wake-up.
+        With touch/mouse attached the nap is a select() on those devices, so a tap
+        wakes the loop at once instead of the loop polling on a short timer.
+        """
+        now_ts = time.time()
+        next_boundary = (math.floor(now_ts / period) * period) + period
+        delay = max(0.01, next_boundary - now_ts + 0.005)  # Minimum 10ms to prevent tight loop
+        wake_fd = getattr(self, '_wake_fd', None)
+        if self.input_devices or wake_fd is not None:
+            # The signal wakeup pipe is in the set too, so SIGTERM ends the nap at once
+            fds = list(self.input_devices)
+            if wake_fd is not None:
+                fds.append(wake_fd)
+            try:
+                ready, _, _ = select.select(fds, [], [], delay)
+                if wake_fd is not None and wake_fd in ready:
+                    self._drain_wake_fd()
+                return
+            except (OSError, ValueError) as e:
+                logging.debug(f"Input select error: {e}")
+        time.sleep(delay)
+    
+    def _drain_wake_fd(self):
+        """Empty the signal wakeup pipe so it can't keep select() returning at once."""
+        try:
+            while os.read(self._wake_fd, 512):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+    
+    def _request_stop(self, signum, frame):
+        """SIGINT/SIGTERM handler: let the loop finish its iteration and exit through cleanup()."""
+        logging.info(f"Received {signal.Signals(signum).name} - stopping clock")
+        self.running = False
+    
+    def _install_signal_handlers(self):
+        """Route SIGINT/SIGTERM to _request_stop and wake a sleeping loop via a self-pipe.
+        Only possible from the main thread; elsewhere the default handlers stay in place.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            logging.debug("Not on the main thread - keeping default signal handlers")
+            return
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        os.set_blocking(wake_w, False)
+        signal.set_wakeup_fd(wake_w)
+        self._wake_fd = wake_r
+        self._wake_fd_w = wake_w
+        signal.signal(signal.SIGINT, self._request_stop)
+        signal.signal(signal.SIGTERM, self._request_stop)
+    
     def run(self):
         """Main loop."""
         logging.info("Starting framebuffer clock display loop")
         logging.info("Press 'S' key to open settings menu")
         
-        # Initial updates
-        self.update_weather()
-        self.check_network_status()
+        # Ctrl+C and docker/balena stop requests just clear self.running
+        self._install_signal_handlers()
+        
+        # Network/NTP checks and weather fetches run in the background
+        self.start_background_workers()
         
         frame_count = 0
         last_second = -1
         last_minute = -1  # Track minute too to ensure we never skip
         loop_count = 0
+        next_stats_log = time.monotonic() + 300.0  # Log stats every 5 minutes (reduce I/O)
+        overlay_was_shown = False
         
         try:
             while self.running:
@@ -1852,41 +2508,49 @@ class FramebufferClock:
                 self._poll_input()
                 
                 # Check if second has changed (also check minute to handle sleep overshoots)
-                current_second = datetime.now().second
-                current_minute = datetime.now().minute
+                # Take both from one reading so they can't straddle a boundary
+                loop_now = datetime.now()
+                current_second = loop_now.second
+                current_minute = loop_now.minute
                 
                 # Decide whether to render this loop
-                if self.show_seconds:
+                if self.show_settings_overlay or overlay_was_shown:
+                    # Interactive: check every wake-up so taps show at once (unchanged frames are skipped in render);
+                    # also on the wake-up after Close, or the menu would stay up until the next minute
+                    render_due = True
+                elif self.show_seconds:
                     render_due = (current_second != last_second) or (current_minute != last_minute)
                 else:
                     # Throttle: when seconds are hidden, redraw on minute change (reduces CPU)
                     render_due = (current_minute != last_minute)
 
                 if render_due:
-                    # Skip expensive updates if overlay is showing
-                    if not self.show_settings_overlay:
-                        # Update weather periodically
-                        self.update_weather()
-                        
-                        # Update status information
-                        self.update_status()
+                    # Skip expensive updates if overlay is showing; both only ever act at
+                    # second 0 (shifting mid-minute would tear), so that's the only time to ask
+                    if not self.show_settings_overlay and current_second == 0:
+                        # One monotonic reading for all interval checks this frame
+                        loop_ticks = time.monotonic()
                         
                         # Update pixel shift
-                        self.update_pixel_shift()
+                        self.update_pixel_shift(loop_now, loop_ticks)
                         
                         # Update burn-in protection: vary font size and font family
-                        self.update_burn_in_protection()
+                        self.update_burn_in_protection(loop_now, loop_ticks)
                     
                     # Render
-                    self.render()
+                    self.render(loop_now)
+                    overlay_was_shown = self.show_settings_overlay
                     
                     last_second = current_second
                     last_minute = current_minute
                     frame_count += 1
                     
-                    if frame_count % 300 == 0:  # Log every 5 minutes (reduce I/O)
-                        avg_loops = loop_count / frame_count if frame_count > 0 else 0
+                    # Deadline rather than every N renders: the render rate varies with show_seconds/overlay
+                    stats_now = time.monotonic()
+                    if stats_now >= next_stats_log:
+                        avg_loops = loop_count / frame_count
                         logging.info(f"Clock stats: {frame_count} renders, {loop_count} loops, {avg_loops:.1f} loops/render")
+                        next_stats_log = stats_now + 300.0
                 
                 # Check for restart flag
                 if os.path.exists('/tmp/restart_clock'):
@@ -1901,21 +2565,16 @@ class FramebufferClock:
                 if self.show_settings_overlay:
                     hz = getattr(self, 'overlay_refresh_hz', 10.0)
                     interval = 1.0 / max(1.0, float(hz))
-                    time.sleep(interval)
-                elif not self.show_seconds and not self.show_settings_overlay:
-                    now_ts = time.time()
-                    next_minute = (math.floor(now_ts / 60.0) * 60.0) + 60.0
-                    delay = max(0.01, next_minute - now_ts)  # Minimum 10ms
-                    time.sleep(delay)
+                    # Wake on wall-clock multiples of the interval rather than sleep(interval) after
+                    # the work, so loop time doesn't accumulate as drift against the second flip
+                    self._sleep_until_boundary(interval)
+                elif self._screensaver_blanked or (not self.show_seconds and not self.show_settings_overlay):
+                    # Screensaver windows are whole hours - nothing to do until the next minute
+                    self._sleep_until_boundary(60.0)
                 else:
                     # With seconds shown: align to next second boundary
-                    now_ts = time.time()
-                    next_second = math.floor(now_ts) + 1.0
-                    delay = max(0.01, next_second - now_ts)  # Minimum 10ms to prevent tight loop
-                    time.sleep(delay)
+                    self._sleep_until_boundary(1.0)
         
-        except KeyboardInterrupt:
-            logging.info("Clock interrupted by user")
         except Exception as e:
             logging.error(f"Error in clock loop: {e}", exc_info=True)
         finally:
@@ -1924,7 +2583,28 @@ class FramebufferClock:
     def cleanup(self):
         """Cleanup resources."""
         logging.info("Framebuffer clock stopped")
+        self.running = False
+        if getattr(self, '_worker_stop', None):
+            self._worker_stop.set()
+        if self._screensaver_blanked:
+            # Don't leave the panel dark for whatever runs next (restart, update, crash recovery)
+            self._set_display_blank(False)
+            self._screensaver_blanked = False
+        if getattr(self, '_wake_fd', None) is not None:
+            try:
+                signal.set_wakeup_fd(-1)
+            except ValueError:
+                pass
+            for fd in (self._wake_fd, self._wake_fd_w):
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            self._wake_fd = None
+            self._wake_fd_w = None
         try:
+            # Drop the numpy view first - mmap refuses to close while buffers are exported
+            self._fb_view = None
             if getattr(self, 'fb_mmap', None):
                 self.fb_mmap.close()
             if getattr(self, '_fb_file', None):
@@ -1935,8 +2615,6 @@ class FramebufferClock:
 
 def main():
     """Main entry point."""
-    from utils import setup_logging, load_build_info, log_runtime_summary
-    
     # Setup logging
     log_level = os.environ.get('LOG_LEVEL', 'INFO')
     setup_logging(log_level)
@@ -1952,13 +2630,13 @@ def main():
     try:
         # Load base configuration
         with open(CONFIG_PATH, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YamlSafeLoader)
         logging.info("Base configuration loaded from config.yaml")
         
         # Override with settings from UI if available
         if SETTINGS_PATH.exists():
             with open(SETTINGS_PATH, 'r') as f:
-                ui_settings = yaml.safe_load(f) or {}
+                ui_settings = yaml.load(f, Loader=YamlSafeLoader) or {}
             logging.info(f"Loaded {len(ui_settings)} settings from settings UI")
             
             # Map UI setting names to config structure
@@ -11,6 +11,16 @@ if [ -n "$TIMEZONE" ]; then
     echo "$TIMEZONE" > /etc/timezone 2>/dev/null || true
 fi
 
+# Keep the kernel console from drawing on the framebuffer we render to directly.
+# A blinking fbcon cursor repaints part of /dev/fb0 twice a second, fighting our
+# partial (dirty-rect) updates and costing CPU on every blink.
+if [ -w /sys/class/graphics/fbcon/cursor_blink ]; then
+    echo 0 > /sys/class/graphics/fbcon/cursor_blink 2>/dev/null || true
+fi
+if [ -w /dev/tty1 ]; then
+    printf '\033[?25l' > /dev/tty1 2>/dev/null || true
+fi
+
 # Launch clock application
 echo "Launching clock application..."
 cd /app
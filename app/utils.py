@@ -3,12 +3,18 @@ Utility Functions - Logging configuration and build info helpers.
 """
 
 import logging
+import os
+import re
 import sys
 import json
 from pathlib import Path
 from typing import Optional
 
 
+# Environment variable names whose values are never logged in clear
+SENSITIVE_ENV_RE = re.compile(r'API_KEY|TOKEN|PASSWORD|SECRET')
+
+
 def setup_logging(log_level: str = 'INFO'):
     """
     Setup logging configuration for the application.
@@ -71,10 +77,8 @@ def log_runtime_summary(config: dict, build_info: Optional[dict] = None):
         config: Application configuration dict
         build_info: Build information dict from build-info.json
     """
-    import os
-    
     # Runtime summary
-    rtc_status = "Enabled" if config.get('time', {}).get('rtc_enabled', False) else "Disabled"
+    rtc_status = "Enabled" if (config.get('time') or {}).get('rtc_enabled', False) else "Disabled"
     logging.info(f"Runtime summary: PIL RGB565 | Icons: Vector | RTC: {rtc_status}")
     logging.info("Status icons: network, sync_ok, sync_old, error, settings")
     
@@ -107,7 +111,6 @@ def log_runtime_summary(config: dict, build_info: Optional[dict] = None):
     logging.info("Environment variables (masked where sensitive):")
     
     # Service-level variables (from device/fleet config)
-    sensitive_keys = ['API_KEY', 'TOKEN', 'PASSWORD', 'SECRET']
     env_vars = {
         'WEATHER_API_KEY': os.getenv('WEATHER_API_KEY') or os.getenv('BALENA_WEATHER_API_KEY'),
         'WEATHER_LOCATION': os.getenv('WEATHER_LOCATION') or os.getenv('BALENA_WEATHER_LOCATION'),
@@ -126,9 +129,6 @@ def log_runtime_summary(config: dict, build_info: Optional[dict] = None):
     for key, value in env_vars.items():
         if value is not None:
             # Mask sensitive values
-            if any(s in key.upper() for s in sensitive_keys):
-                masked_value = '****'
-            else:
-                masked_value = value
+            masked_value = '****' if SENSITIVE_ENV_RE.search(key) else value
             
             logging.info(f"  [Service(clock)] {key}={masked_value}")
@@ -3,7 +3,9 @@ Weather Service Module - Fetches weather data from OpenWeatherMap API.
 Includes error handling, caching, and fallback mechanisms.
 """
 
+import json
 import logging
+import os
 import requests
 from datetime import datetime, timedelta
 from typing import Optional, Dict
@@ -14,7 +16,6 @@ class WeatherService:
     
     def __init__(self, weather_config: dict):
         """Initialize weather service with configuration."""
-        import os
         # Environment variables override config file settings
         self.api_key = os.environ.get('WEATHER_API_KEY') or weather_config.get('api_key', '')
         self.location = os.environ.get('WEATHER_LOCATION') or weather_config.get('location', '')
@@ -23,12 +24,18 @@ class WeatherService:
         
         # API endpoint
         self.base_url = "https://api.openweathermap.org/data/2.5/weather"
+        # One session for all fetches - reuses the connection pool (and TLS session) between requests
+        self._session = requests.Session()
         
         # Cache settings
         self.cache_duration = timedelta(minutes=10)
         self.cached_data = None
         self.last_fetch_time = None
         
+        # On-disk copy of the last response so a restart doesn't refetch (/data is a persistent volume)
+        self.cache_file = os.environ.get('WEATHER_CACHE_FILE') or weather_config.get('cache_file', '/data/weather_cache.json')
+        self._load_disk_cache()
+        
         # Validate configuration
         if not self.api_key:
             logging.warning("Weather API key not provided - weather display will be disabled")
@@ -55,6 +62,7 @@ class WeatherService:
             if weather_data:
                 self.cached_data = weather_data
                 self.last_fetch_time = datetime.now()
+                self._save_disk_cache()
                 logging.info("Weather data fetched and cached successfully")
             return weather_data
         except Exception as e:
@@ -62,6 +70,43 @@ class WeatherService:
             # Return cached data even if stale, better than nothing
             return self.cached_data
     
+    def _cache_identity(self) -> list:
+        """What a cached response depends on - a cache for another location/units is ignored."""
+        return [self.location, self.units, self.language]
+    
+    def _load_disk_cache(self):
+        """Seed the in-memory cache from the on-disk copy, if it matches this configuration."""
+        if not self.cache_file:
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                cached = json.load(f)
+            if cached.get('identity') != self._cache_identity():
+                return
+            self.cached_data = cached['data']
+            self.last_fetch_time = datetime.fromtimestamp(cached['fetched_at'])
+            logging.info(f"Loaded cached weather data from {self.cache_file} (fetched {self.last_fetch_time:%H:%M})")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.debug(f"Ignoring unreadable weather cache {self.cache_file}: {e}")
+    
+    def _save_disk_cache(self):
+        """Write the cached response to disk (atomically, so a crash never leaves a partial file)."""
+        if not self.cache_file:
+            return
+        try:
+            tmp_path = f"{self.cache_file}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    'identity': self._cache_identity(),
+                    'fetched_at': self.last_fetch_time.timestamp(),
+                    'data': self.cached_data,
+                }, f)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            logging.debug(f"Could not write weather cache {self.cache_file}: {e}")
+    
     def _is_cache_valid(self) -> bool:
         """Check if cached weather data is still valid."""
         if self.cached_data is None or self.last_fetch_time is None:
@@ -92,7 +137,7 @@ class WeatherService:
             
             # Make API request with timeout
             logging.debug(f"Fetching weather for: {self.location}")
-            response = requests.get(
+            response = self._session.get(
                 self.base_url,
                 params=params,
                 timeout=2  # 2 second timeout to avoid blocking the display
@@ -4,6 +4,7 @@
 import time
 import os
 os.environ['SDL_VIDEODRIVER'] = 'dummy'  # Headless mode for testing
+os.environ.setdefault('PYGAME_BLEND_ALPHA_SDL2', '1')  # Use SDL2's (NEON) blitters on the Pi, must be set before import
 
 import pygame
 from PIL import Image, ImageDraw, ImageFont
@@ -79,7 +80,9 @@ print()
 
 # Pygame Benchmark
 print("Testing Pygame (sprite cache approach)...")
-pygame.init()
+# Only init the subsystems used here - pygame.init() would also probe audio (ALSA) on a Pi
+pygame.display.init()
+pygame.font.init()
 screen = pygame.display.set_mode((1920, 1200))
 pygame_font = pygame.font.Font(font_file, FONT_SIZE)
 
@@ -0,0 +1,93 @@
+"""Incremental rendering must match a fresh render when elements overlap.
+
+The weather line sits inside the date canvas and the cursor can sit on top of
+either, so a blit of one element overwrites pixels of another. Each frame of
+a replay is compared against the same frame rendered from a blank shadow.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+sys.path.insert(0, str(APP_DIR))
+
+
+def _make_clock(monkeypatch, fb_path):
+    import framebuffer_clock
+    fb_path.write_bytes(b"\0" * (1920 * 1200 * 2))
+    monkeypatch.setenv("FRAMEBUFFER", str(fb_path))
+    config = yaml.safe_load((APP_DIR / "config.yaml").read_text())
+    config["weather"]["enabled"] = False
+    clock = framebuffer_clock.FramebufferClock(config, build_info={"git_version": "v1", "git_sha": "abcdef123"})
+    clock.pixel_shift_enabled = False
+    clock.weather_text = "72° Clear"
+    return clock
+
+
+def _fresh_render(clock, now):
+    """Render now into a blank shadow, forgetting everything drawn before."""
+    clock.fb_shadow.fill(0)
+    clock._blit_sources.clear()
+    clock._dirty_rects.clear()
+    for attr in [a for a in vars(clock) if a.startswith("_last_") and a.endswith("_rect")]:
+        setattr(clock, attr, None)
+    clock._last_frame_key = None
+    clock.render(now)
+    return clock.fb_shadow
+
+
+@pytest.fixture
+def clocks(monkeypatch, tmp_path):
+    if not any(Path(p).exists() for p in ("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+                                           "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf")):
+        pytest.skip("TrueType fonts not installed")
+    incremental = _make_clock(monkeypatch, tmp_path / "fb_incremental")
+    fresh = _make_clock(monkeypatch, tmp_path / "fb_fresh")
+    yield incremental, fresh
+    incremental.cleanup()
+    fresh.cleanup()
+
+
+def _replay(incremental, fresh, start, seconds, mutate=None):
+    for i in range(seconds):
+        now = start + timedelta(seconds=i)
+        if mutate:
+            mutate(i)
+        incremental.render(now)
+        expected = _fresh_render(fresh, now)
+        assert int((incremental.fb_shadow != expected).sum()) == 0, f"shadow differs at {now:%H:%M:%S}"
+        assert int((np.asarray(incremental._fb_view) != incremental.fb_shadow).sum()) == 0, f"framebuffer differs at {now:%H:%M:%S}"
+
+
+def test_date_change_redraws_weather_inside_date_canvas(clocks):
+    incremental, fresh = clocks
+    _replay(incremental, fresh, datetime(2026, 10, 16, 23, 59, 58), 6)
+
+
+def test_weather_change_and_brightness_flip(clocks):
+    incremental, fresh = clocks
+
+    def change_weather(i):
+        if i == 3:
+            for clock in clocks:
+                clock.weather_text = "68° Cloudy, light rain"
+
+    _replay(incremental, fresh, datetime(2026, 10, 17, 12, 30, 0), 6, change_weather)
+    _replay(incremental, fresh, datetime(2026, 10, 17, 5, 59, 57), 5)
+
+
+def test_cursor_over_time_and_date(clocks):
+    incremental, fresh = clocks
+    for clock in clocks:
+        clock.input_devices = [object()]
+
+    def move_cursor(i):
+        for clock in clocks:
+            clock.pointer_x, clock.pointer_y = 900 + i * 37, 690 + i * 9
+
+    _replay(incremental, fresh, datetime(2026, 10, 17, 9, 0, 0), 8, move_cursor)